@@ -4,18 +4,38 @@ This module provides validation for transport data files converted to AC1 format
 following the OceanSITES/AC1 specification.
 """
 
+from __future__ import annotations
+
 import re
-import xarray as xr
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import netCDF4
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    # xarray is only needed for annotations and the use_xarray reader, so it is
+    # imported on first use to keep the netCDF4 validation path light
+    import xarray as xr
+
+# ``slots=True`` needs Python 3.10; on 3.9 fall back to a plain dataclass.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
-    """Container for validation results."""
+    """Container for validation results.
+
+    Slotted on Python 3.10+ so batch validation allocates no per-instance
+    ``__dict__``.
+    """
 
     passed: bool
     errors: List[str] = field(default_factory=list)
@@ -139,6 +159,14 @@ RAPID_SPECS = {
         "gridded_sections": r"^OS_RAPID_(\d{8})-(\d{8})_GRD_sections_T10D\.nc$",
         "gridded_moorings": r"^OS_RAPID_(\d{8})-(\d{8})_GRD_gridded_mooring\.nc$",
     },
+    # File types keyed by (ContentType, PARTX) from the general filename pattern
+    "partx_to_type": {
+        ("DPR", "transports_T12H"): "component_transports",
+        ("DPR", "transports_T10D"): "meridional_transports",
+        ("DPR", "streamfunction_T12H"): "streamfunction",
+        ("GRD", "sections_T10D"): "gridded_sections",
+        ("GRD", "gridded_mooring"): "gridded_moorings",
+    },
     # Array-specific attributes
     "site_code": "RAPID",
     "array": "RAPID",
@@ -182,6 +210,228 @@ RAPID_SPECS = {
 }
 
 
+def _strip_anchors(pattern: str) -> str:
+    """Remove a leading ``^`` and trailing ``$`` from a regex pattern."""
+    if pattern.startswith("^"):
+        pattern = pattern[1:]
+    if pattern.endswith("$") and not pattern.endswith("\\$"):
+        pattern = pattern[:-1]
+    return pattern
+
+
+# Compiled once at import; the validators run these on every file checked.
+# All are used with fullmatch, so the patterns carry no ^/$ anchors.
+_TIME_COVERAGE_RE = re.compile(r"\d{8}T\d{6}")
+_ORCID_RE = re.compile(r"https://orcid\.org/\d{4}-\d{4}-\d{4}-\d{3}[0-9X]")
+_ID_RE = re.compile(r"OS_[A-Z0-9]+_\d{8}-\d{8}_[A-Z]{3}_[A-Za-z0-9_T]+")
+_FILENAME_RE = re.compile(_strip_anchors(GENERIC_SPECS["general_filename_pattern"]))
+
+# Split comma-separated lists and strip the entries in one pass
+_CSV_SPLIT_RE = re.compile(r"\s*,\s*")
+# Any mention of orcid.org, regardless of case, marks an ORCID identifier
+_ORCID_HINT_RE = re.compile(r"orcid\.org", re.IGNORECASE)
+
+# Dimension name -> CF ordering category (components leftmost, then T, Z, Y, X)
+_DIM_CATEGORY = {
+    "TIME": "T",
+    "DEPTH": "Z",
+    "PRESSURE": "Z",
+    "SIGMA0": "Z",
+    "LATITUDE": "Y",
+    "LONGITUDE": "X",
+    "N_COMPONENT": "C",
+}
+
+# Read-only views of the GENERIC_SPECS entries used in the per-variable checks
+_REQUIRED_VOCABS = MappingProxyType(GENERIC_SPECS["required_vocabularies"])
+_APPROVED_UNITS_BY_SN = MappingProxyType(
+    GENERIC_SPECS["approved_units_by_standard_name"]
+)
+_ALT_UNITS = MappingProxyType(GENERIC_SPECS["alternative_units"])
+_REQUIRED_CONVENTIONS = tuple(GENERIC_SPECS["required_conventions"])
+_REQUIRED_VAR_ATTRS = ("long_name", "units")
+
+# Standard names with approved units, and coordinates checked without one
+_APPROVED_STD_NAMES = frozenset(_APPROVED_UNITS_BY_SN)
+_COORD_VAR_NAMES = frozenset({"TIME", "LATITUDE", "LONGITUDE", "DEPTH"})
+
+# Descriptive/categorical variables that don't need physical units
+_UNITLESS_VARS = frozenset({"TRANSPORT_NAME", "TRANSPORT_DESCRIPTION"})
+
+# Approved units merged with alternatives per standard_name (approved unit first)
+_ACCEPTABLE_UNITS = {
+    standard_name: tuple(dict.fromkeys((units, *_ALT_UNITS.get(standard_name, ()))))
+    for standard_name, units in _APPROVED_UNITS_BY_SN.items()
+}
+
+# Membership constants for the global attribute checks. The small enumerations
+# stay as tuples so error messages list them in specification order.
+_REQUIRED_GLOBAL_ATTRS = frozenset(GENERIC_SPECS["required_global_attrs"])
+_VALID_DATA_MODES = ("R", "P", "D")  # Real-time, Provisional, Delayed
+_VALID_QC_INDICATORS = ("unknown", "excellent", "probably good", "mixed")
+_VALID_CDM_TYPES = (
+    "TimeSeries",
+    "TimeSeriesProfile",
+    "Trajectory",
+    "TrajectoryProfile",
+    "Profile",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_yyyymmdd(date_str: str) -> datetime:
+    """Parse an 8-digit ``YYYYMMDD`` filename date.
+
+    Avoids ``datetime.strptime``; dates repeat across files in a batch, so
+    results are cached. Raises ValueError for impossible dates.
+    """
+    return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+
+
+def _is_time_variable(var: xr.DataArray) -> bool:
+    """Return True for datetime64 or CF-encoded (``<units> since <epoch>``) times."""
+    if var.dtype.kind == "M":
+        return True
+    units = var.attrs.get("units")
+    return isinstance(units, str) and " since " in units
+
+
+def _masked_values(var: xr.DataArray) -> np.ndarray:
+    """Return variable data with ``_FillValue``/``missing_value`` replaced by NaN.
+
+    Files are read without CF decoding, so fill values are still present in
+    the raw data and must be excluded before range checks.
+    """
+    data = np.asarray(var.values)
+    fill_values = [
+        var.attrs[name] for name in ("_FillValue", "missing_value") if name in var.attrs
+    ]
+    if fill_values and data.dtype.kind in "fiu":
+        is_fill = np.isin(data, fill_values)
+        if is_fill.any():
+            data = np.where(is_fill, np.nan, data)
+    return data
+
+
+def _nan_bounds(values: np.ndarray) -> tuple:
+    """Return ``(min, max)`` of the values, ignoring NaNs, in one pass each.
+
+    Unlike ``np.nanmin``/``np.nanmax`` this returns NaN without warning when
+    every value is missing (or the array is empty), so range comparisons
+    against the bounds are simply False.
+    """
+    if values.size == 0:
+        return np.nan, np.nan
+    return np.fmin.reduce(values, axis=None), np.fmax.reduce(values, axis=None)
+
+
+def _encode_dataset(ds: xr.Dataset) -> xr.Dataset:
+    """CF-encode a dataset in memory as ``to_netcdf`` would before writing.
+
+    The result looks like the written file opened without CF decoding: times
+    are numbers with ``units``, fill values are attributes and only dimension
+    variables are coordinates.
+    """
+    import xarray as xr
+    from xarray import conventions
+
+    variables, attrs = conventions.encode_dataset_coordinates(ds)
+    variables, attrs = conventions.cf_encoder(variables, attrs)
+    return xr.Dataset(variables, attrs=attrs)
+
+
+class _NCVariable:
+    """Read-only view of a netCDF4 variable with the xarray attributes used here.
+
+    Attributes and dimensions are read eagerly; data is only read from disk
+    when ``values`` is accessed.
+    """
+
+    def __init__(self, var: netCDF4.Variable) -> None:
+        self._var = var
+        self.attrs = {name: var.getncattr(name) for name in var.ncattrs()}
+        self.dims = var.dimensions
+        self.dtype = np.dtype(var.dtype)
+
+    def __len__(self) -> int:
+        return self._var.shape[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Raw (undecoded) variable data."""
+        return np.asarray(self._var[:])
+
+
+class _NCView:
+    """Metadata view of an open ``netCDF4.Dataset`` mirroring ``xr.Dataset``.
+
+    Exposes ``attrs``, ``sizes``, ``dims``, ``variables``, ``coords`` and
+    ``data_vars`` without CF decoding, index construction or lazy-array
+    wrapping, matching ``xr.open_dataset(..., decode_cf=False)``.
+    """
+
+    def __init__(self, nc: netCDF4.Dataset) -> None:
+        self._nc = nc
+        self.attrs = {name: nc.getncattr(name) for name in nc.ncattrs()}
+        self.sizes = {name: len(dim) for name, dim in nc.dimensions.items()}
+        self.dims = self.sizes
+        self.variables = {name: _NCVariable(var) for name, var in nc.variables.items()}
+
+        # Without coordinate decoding only dimension variables are coordinates
+        self.coords = {
+            name: var for name, var in self.variables.items() if name in self.sizes
+        }
+        self.data_vars = {
+            name: var for name, var in self.variables.items() if name not in self.sizes
+        }
+
+    def __getitem__(self, name: str) -> _NCVariable:
+        return self.variables[name]
+
+    def close(self) -> None:
+        """Close the underlying netCDF4 dataset."""
+        self._nc.close()
+
+
+@lru_cache(maxsize=16)
+def _build_derived_array_specs(
+    file_patterns: tuple, site_code: str, array: str, data_mode: str
+) -> tuple:
+    """Build the compiled/precomputed structures for one set of array specs.
+
+    Cached on the spec values it uses, so equal specs share one build and a
+    spec changed in place is rebuilt rather than served stale.
+    """
+    # Combine the array file patterns into one alternation so the file type
+    # is found with a single match; group names are positional so any file
+    # type key can be used
+    file_types = tuple(file_type for file_type, _ in file_patterns)
+    file_type_re = re.compile(
+        "|".join(
+            f"(?P<_ft{i}>{_strip_anchors(pattern)})"
+            for i, (_, pattern) in enumerate(file_patterns)
+        )
+    )
+
+    # (attribute, expected value, label used in the error message)
+    scalar_checks = (
+        ("site_code", site_code, site_code),
+        ("array", array, array),
+        ("data_mode", data_mode, site_code),
+    )
+    return file_types, file_type_re, scalar_checks
+
+
+def _derived_array_specs(array_specs: dict) -> tuple:
+    """Return cached derived structures for ``array_specs``, building on first use."""
+    return _build_derived_array_specs(
+        tuple(array_specs["file_patterns"].items()),
+        array_specs["site_code"],
+        array_specs["array"],
+        array_specs["data_mode"],
+    )
+
+
 class AC1ComplianceChecker:
     """Compliance checker for AMOCatlas AC1 format files.
 
@@ -196,19 +446,38 @@ class AC1ComplianceChecker:
         Parameters
         ----------
         array_specs : dict, optional
-            Array-specific specifications. Defaults to RAPID_SPECS.
+            Array-specific specifications. Defaults to RAPID_SPECS. Compiled
+            patterns are derived from them here, so changing the specs after
+            the checker is created does not affect it.
 
         """
         self.array_specs = array_specs if array_specs is not None else RAPID_SPECS
         self.generic_specs = GENERIC_SPECS
+        # (name, range, positive_down_range) for coordinates with value limits
+        self._coord_specs = tuple(
+            (name, spec.get("range"), spec.get("positive_down_range"))
+            for name, spec in self.generic_specs["coordinate_specs"].items()
+            if "range" in spec or "positive_down_range" in spec
+        )
 
-    def validate_file(self, filepath: str) -> ValidationResult:
+        (
+            self._file_types,
+            self._file_type_re,
+            self._array_scalar_checks,
+        ) = _derived_array_specs(self.array_specs)
+
+    def validate_file(
+        self, filepath: str, use_xarray: bool = False
+    ) -> ValidationResult:
         """Validate a file against AC1 format specification.
 
         Parameters
         ----------
         filepath : str
             Path to the NetCDF file to validate
+        use_xarray : bool, optional
+            If True, open the file with ``xr.open_dataset`` instead of reading
+            its metadata directly with netCDF4. Default is False.
 
         Returns
         -------
@@ -219,8 +488,9 @@ class AC1ComplianceChecker:
         result = ValidationResult(passed=True)
 
         try:
-            # Validate filename
-            file_type = self._validate_filename(filepath, result)
+            # Validate filename; the match is reused for the data value checks
+            filename_match = _FILENAME_RE.fullmatch(Path(filepath).name)
+            file_type = self._validate_filename(filepath, result, filename_match)
             result.file_type = file_type
 
             if not file_type:
@@ -229,17 +499,28 @@ class AC1ComplianceChecker:
 
             # Load dataset
             try:
-                ds = xr.open_dataset(filepath)
+                # Only metadata and raw values are checked, so skip CF decoding
+                if use_xarray:
+                    import xarray as xr
+
+                    ds = xr.open_dataset(
+                        filepath,
+                        decode_cf=False,
+                        decode_times=False,
+                        decode_coords=False,
+                        mask_and_scale=False,
+                    )
+                else:
+                    nc = netCDF4.Dataset(filepath, mode="r")
+                    nc.set_auto_maskandscale(False)
+                    ds = _NCView(nc)
             except Exception as e:
                 result.errors.append(f"Failed to open NetCDF file: {e}")
                 result.passed = False
                 return result
 
             # Run validation checks
-            self._validate_dimensions(ds, file_type, result)
-            self._validate_variables(ds, file_type, result)
-            self._validate_global_attributes(ds, result)
-            self._validate_data_values(ds, filepath, result)
+            self._run_checks(ds, filepath, file_type, result, filename_match)
 
             ds.close()
 
@@ -252,16 +533,113 @@ class AC1ComplianceChecker:
 
         return result
 
+    def validate_dataset(self, ds: xr.Dataset, filename: str) -> ValidationResult:
+        """Validate an in-memory dataset as if it were saved as ``filename``.
+
+        The dataset is CF-encoded in memory the same way ``to_netcdf`` would
+        write it, so the result matches validating the written file without
+        the write and re-read.
+
+        Parameters
+        ----------
+        ds : xarray.Dataset
+            Dataset to validate
+        filename : str
+            File name (or path) the dataset would be saved under; used for the
+            filename checks and the TIME range
+
+        Returns
+        -------
+        ValidationResult
+            Validation results with errors and warnings
+
+        """
+        result = ValidationResult(passed=True)
+
+        try:
+            filename_match = _FILENAME_RE.fullmatch(Path(filename).name)
+            file_type = self._validate_filename(filename, result, filename_match)
+            result.file_type = file_type
+
+            if not file_type:
+                result.passed = False
+                return result
+
+            self._run_checks(
+                _encode_dataset(ds), filename, file_type, result, filename_match
+            )
+
+        except Exception as e:
+            result.errors.append(f"Unexpected error during validation: {e}")
+
+        result.passed = len(result.errors) == 0
+
+        return result
+
+    def _run_checks(
+        self,
+        ds: xr.Dataset,
+        filepath: str,
+        file_type: str,
+        result: ValidationResult,
+        filename_match: Optional[re.Match] = None,
+    ):
+        """Run the dimension, variable, attribute and data value checks."""
+        self._validate_dimensions(ds, file_type, result)
+        self._validate_variables(ds, file_type, result)
+        self._validate_global_attributes(ds, result)
+        self._validate_data_values(ds, filepath, result, filename_match)
+
+    @classmethod
+    def validate_files(
+        cls,
+        filepaths: Iterable[str],
+        array_specs=None,
+        workers: Optional[int] = None,
+        use_xarray: bool = False,
+    ) -> Dict[str, ValidationResult]:
+        """Validate several files in parallel across worker processes.
+
+        Files are independent, so each worker process builds one checker and
+        validates its share of the files with ``validate_file``.
+
+        Parameters
+        ----------
+        filepaths : iterable of str
+            Paths to the NetCDF files to validate
+        array_specs : dict, optional
+            Array-specific specifications. Defaults to RAPID_SPECS.
+        workers : int, optional
+            Number of worker processes. Defaults to the number of CPUs.
+        use_xarray : bool, optional
+            If True, open files with xarray instead of netCDF4. Default is False.
+
+        Returns
+        -------
+        dict
+            Validation results keyed by file path, in input order
+
+        """
+        filepaths = [str(filepath) for filepath in filepaths]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker,
+            initargs=(cls, array_specs, use_xarray),
+        ) as executor:
+            results = executor.map(_validate_in_worker, filepaths, chunksize=8)
+            return dict(zip(filepaths, results))
+
     def _validate_filename(
-        self, filepath: str, result: ValidationResult
+        self,
+        filepath: str,
+        result: ValidationResult,
+        filename_match: Optional[re.Match] = None,
     ) -> Optional[str]:
         """Validate filename against OceanSITES convention."""
         filename = Path(filepath).name
 
         # Check general OceanSITES pattern first
-        general_match = re.match(
-            self.generic_specs["general_filename_pattern"], filename
-        )
+        general_match = filename_match or _FILENAME_RE.fullmatch(filename)
         if not general_match:
             result.errors.append(
                 "Filename must follow OceanSITES pattern: OS_[PSPANCode]_[StartEndCode]_[ContentType]_[PARTX].nc"
@@ -287,8 +665,8 @@ class AC1ComplianceChecker:
 
         # Validate date format and range
         try:
-            start_dt = datetime.strptime(start_date, "%Y%m%d")
-            end_dt = datetime.strptime(end_date, "%Y%m%d")
+            start_dt = _parse_yyyymmdd(start_date)
+            end_dt = _parse_yyyymmdd(end_date)
 
             if start_dt > end_dt:
                 result.errors.append(
@@ -298,12 +676,16 @@ class AC1ComplianceChecker:
             result.errors.append(f"Invalid date format in filename: {e}")
             return None
 
-        # Try to determine specific file type from array patterns
-        file_type = None
-        for ftype, pattern in self.array_specs["file_patterns"].items():
-            if re.match(pattern, filename):
-                file_type = ftype
-                break
+        # Determine specific file type from the parsed filename components,
+        # falling back to the array file patterns for specs without a lookup
+        partx_to_type = self.array_specs.get("partx_to_type")
+        if partx_to_type is not None:
+            file_type = partx_to_type.get((content_type, partx))
+        else:
+            file_type = None
+            type_match = self._file_type_re.fullmatch(filename)
+            if type_match:
+                file_type = self._file_types[int(type_match.lastgroup[3:])]
 
         if not file_type:
             # If no specific pattern matches, create a generic type based on content
@@ -333,7 +715,7 @@ class AC1ComplianceChecker:
         if "TIME" not in ds.sizes:
             result.errors.append("TIME dimension is required")
         else:
-            if not ds.sizes["TIME"] == len(ds.TIME):
+            if "TIME" in ds.variables and not ds.sizes["TIME"] == len(ds["TIME"]):
                 result.warnings.append("TIME dimension should be unlimited")
 
     def _validate_array_specific_dimensions(
@@ -345,25 +727,25 @@ class AC1ComplianceChecker:
 
         requirements = self.array_specs["file_requirements"][file_type]
 
+        errors = []
+
         # Check required dimensions with specific sizes
-        if "dimensions" in requirements:
-            for dim_name, expected_size in requirements["dimensions"].items():
-                if dim_name not in ds.sizes:
-                    result.errors.append(
-                        f"{dim_name} dimension required for {file_type}"
-                    )
-                elif ds.sizes[dim_name] != expected_size:
-                    result.errors.append(
-                        f"{dim_name} must be {expected_size}, got {ds.sizes[dim_name]}"
-                    )
+        for dim_name, expected_size in requirements.get("dimensions", {}).items():
+            if dim_name not in ds.sizes:
+                errors.append(f"{dim_name} dimension required for {file_type}")
+            elif ds.sizes[dim_name] != expected_size:
+                errors.append(
+                    f"{dim_name} must be {expected_size}, got {ds.sizes[dim_name]}"
+                )
 
         # Check forbidden dimensions
-        if "forbidden_dimensions" in requirements:
-            for dim_name in requirements["forbidden_dimensions"]:
-                if dim_name in ds.dims:
-                    result.errors.append(
-                        f"{dim_name} dimension should NOT be present in {file_type} files"
-                    )
+        errors.extend(
+            f"{dim_name} dimension should NOT be present in {file_type} files"
+            for dim_name in requirements.get("forbidden_dimensions", ())
+            if dim_name in ds.dims
+        )
+
+        result.errors.extend(errors)
 
     def _validate_dimension_ordering(self, ds: xr.Dataset, result: ValidationResult):
         """Validate CF convention dimension ordering."""
@@ -373,41 +755,26 @@ class AC1ComplianceChecker:
             if len(dims) <= 1:
                 continue
 
-            # Check for proper ordering
-            t_idx = z_idx = y_idx = x_idx = comp_idx = -1
-
-            for i, dim in enumerate(dims):
-                if dim == "TIME":
-                    t_idx = i
-                elif dim in ["DEPTH", "PRESSURE", "SIGMA0"]:
-                    z_idx = i
-                elif dim == "LATITUDE":
-                    y_idx = i
-                elif dim == "LONGITUDE":
-                    x_idx = i
-                elif dim == "N_COMPONENT":
-                    comp_idx = i
+            # Position of each dimension category (last occurrence wins)
+            positions = {
+                _DIM_CATEGORY[dim]: i
+                for i, dim in enumerate(dims)
+                if dim in _DIM_CATEGORY
+            }
 
             # Component dimensions should be leftmost
-            if comp_idx >= 0:
-                for idx in [t_idx, z_idx, y_idx, x_idx]:
-                    if idx >= 0 and comp_idx > idx:
-                        result.errors.append(
-                            f"Variable {var_name}: N_COMPONENT must be leftmost of spatiotemporal dimensions"
-                        )
-                        break
+            comp_idx = positions.pop("C", -1)
+            if comp_idx >= 0 and any(comp_idx > idx for idx in positions.values()):
+                result.errors.append(
+                    f"Variable {var_name}: N_COMPONENT must be leftmost of spatiotemporal dimensions"
+                )
 
             # Check T, Z, Y, X ordering
-            indices = [(t_idx, "TIME"), (z_idx, "Z"), (y_idx, "Y"), (x_idx, "X")]
-            indices = [(i, name) for i, name in indices if i >= 0]
-
-            if len(indices) > 1:
-                for i in range(len(indices) - 1):
-                    if indices[i][0] > indices[i + 1][0]:
-                        result.warnings.append(
-                            f"Variable {var_name}: Dimensions not in T,Z,Y,X order"
-                        )
-                        break
+            ordered = [positions[cat] for cat in "TZYX" if cat in positions]
+            if ordered != sorted(ordered):
+                result.warnings.append(
+                    f"Variable {var_name}: Dimensions not in T,Z,Y,X order"
+                )
 
     def _validate_variables(
         self, ds: xr.Dataset, file_type: str, result: ValidationResult
@@ -433,17 +800,16 @@ class AC1ComplianceChecker:
         requirements = self.array_specs["file_requirements"][file_type]
 
         # Check required variables
-        if "required_variables" in requirements:
-            for var_name in requirements["required_variables"]:
-                if var_name not in ds.data_vars:
-                    result.errors.append(
-                        f"Required variable {var_name} missing for {file_type}"
-                    )
+        result.errors.extend(
+            f"Required variable {var_name} missing for {file_type}"
+            for var_name in requirements.get("required_variables", ())
+            if var_name not in ds.data_vars
+        )
 
     def _validate_coordinates(self, ds: xr.Dataset, result: ValidationResult):
         """Validate coordinate variables using generic specifications."""
         for coord_name, coord_spec in self.generic_specs["coordinate_specs"].items():
-            if coord_name in ds.coords:
+            if coord_name in ds.variables:
                 coord_var = ds[coord_name]
 
                 # Check axis attribute
@@ -469,11 +835,10 @@ class AC1ComplianceChecker:
                             f"{coord_name} units must be '{expected_units}', got '{coord_var.attrs['units']}'"
                         )
                 elif coord_name == "TIME":
-                    # For datetime coordinates, xarray handles units encoding automatically
-                    # Check if it's a datetime coordinate first
-                    if coord_var.dtype.kind == "M":  # numpy datetime64 type
-                        # xarray handles datetime encoding, units are in the encoding, not attrs
-                        pass  # This is fine, xarray manages datetime units automatically
+                    # Datetime coordinates carry their units in the CF encoding
+                    # (or in xarray's encoding once decoded)
+                    if _is_time_variable(coord_var):
+                        pass  # Units are managed by the time encoding
                     elif "units" not in coord_var.attrs:
                         # Only require units attribute for non-datetime TIME coordinates
                         result.errors.append(
@@ -487,161 +852,143 @@ class AC1ComplianceChecker:
         self, var_name: str, var: xr.DataArray, result: ValidationResult
     ):
         """Validate individual variable attributes."""
-        # Required attributes for all variables
-        required_attrs = ["long_name", "units"]
-
-        # Variables that don't need physical units (descriptive/categorical variables)
-        unitless_variables = ["TRANSPORT_NAME", "TRANSPORT_DESCRIPTION"]
+        attrs = var.attrs
+        standard_name = attrs.get("standard_name", "")
 
-        for attr in required_attrs:
-            if attr not in var.attrs:
+        # Required attributes for all variables
+        for attr in _REQUIRED_VAR_ATTRS:
+            if attr not in attrs:
                 # Special handling for datetime coordinates - xarray manages units automatically
                 if attr == "units" and var.dtype.kind == "M":  # datetime64 type
                     continue  # Skip units requirement for datetime variables
                 # Special handling for descriptive variables that don't have physical units
-                if attr == "units" and var_name in unitless_variables:
+                if attr == "units" and var_name in _UNITLESS_VARS:
                     continue  # Skip units requirement for descriptive/categorical variables
                 result.errors.append(
                     f"Variable {var_name} missing required attribute: {attr}"
                 )
 
         # Check _FillValue data type
-        if "_FillValue" in var.attrs:
-            fill_value = var.attrs["_FillValue"]
-            if not isinstance(fill_value, type(var.values.flat[0])):
+        if "_FillValue" in attrs:
+            fill_value = attrs["_FillValue"]
+            # Compare against the dtype rather than a data element so the
+            # variable's values are never read from disk
+            if not isinstance(fill_value, var.dtype.type):
                 result.warnings.append(
                     f"Variable {var_name}: _FillValue type doesn't match variable dtype"
                 )
 
         # Check vocabulary if present
-        if "vocabulary" in var.attrs:
-            vocab_url = var.attrs["vocabulary"]
-            standard_name = var.attrs.get("standard_name", "")
+        if "vocabulary" in attrs:
+            vocab_url = attrs["vocabulary"]
 
-            required_vocabs = self.generic_specs["required_vocabularies"]
-            if standard_name in required_vocabs:
-                expected_vocab = required_vocabs[standard_name]
+            if standard_name in _REQUIRED_VOCABS:
+                expected_vocab = _REQUIRED_VOCABS[standard_name]
                 if vocab_url != expected_vocab:
                     result.errors.append(
                         f"Variable {var_name}: Wrong vocabulary URL. Expected {expected_vocab}, got {vocab_url}"
                     )
 
+        # Fast path: without a standard_name only coordinate units are checked
+        if not standard_name and var_name not in _COORD_VAR_NAMES:
+            return
+
+        # Time units are part of the time encoding, which xarray manages
+        if _is_time_variable(var):
+            return
+
         # Check units against approved list using standard_name
-        if "units" in var.attrs:
-            units = var.attrs["units"]
-            standard_name = var.attrs.get("standard_name", "")
-
-            # Special cases for coordinate variables (may not have standard_name)
-            if var_name == "TIME" and standard_name == "":
-                approved_units = self.generic_specs["approved_units_by_standard_name"]
-                if units != approved_units["time"]:
+        if "units" not in attrs:
+            return
+        units = attrs["units"]
+        approved_units = _APPROVED_UNITS_BY_SN
+
+        # Special cases for coordinate variables (may not have standard_name)
+        if not standard_name:
+            coord_key = var_name.lower()
+            if coord_key in approved_units and units != approved_units[coord_key]:
+                result.errors.append(
+                    f"Variable {var_name}: Non-compliant {coord_key} units '{units}', expected '{approved_units[coord_key]}'"
+                )
+
+        # If standard_name not in our approved list, just issue a warning
+        elif standard_name not in _APPROVED_STD_NAMES:
+            result.warnings.append(
+                f"Variable {var_name}: Unknown standard_name '{standard_name}' - cannot validate units '{units}'"
+            )
+
+        # For variables with standard_name, validate units based on standard_name
+        else:
+            acceptable_units = _ACCEPTABLE_UNITS[standard_name]
+            if units not in acceptable_units:
+                if len(acceptable_units) == 1:
                     result.errors.append(
-                        f"Variable {var_name}: Non-compliant time units '{units}', expected '{approved_units['time']}'"
+                        f"Variable {var_name} (standard_name='{standard_name}'): Non-compliant units '{units}', expected '{acceptable_units[0]}'"
                     )
-            elif var_name in ["LATITUDE", "LONGITUDE", "DEPTH"] and standard_name == "":
-                approved_units = self.generic_specs["approved_units_by_standard_name"]
-                coord_key = var_name.lower()
-                if coord_key in approved_units and units != approved_units[coord_key]:
+                else:
                     result.errors.append(
-                        f"Variable {var_name}: Non-compliant {coord_key} units '{units}', expected '{approved_units[coord_key]}'"
-                    )
-
-            # For variables with standard_name, validate units based on standard_name
-            elif standard_name:
-                approved_units = self.generic_specs["approved_units_by_standard_name"]
-                alternative_units = self.generic_specs.get("alternative_units", {})
-
-                if standard_name in approved_units:
-                    expected_units = approved_units[standard_name]
-                    acceptable_units = [expected_units]
-
-                    # Add alternative units if available
-                    if standard_name in alternative_units:
-                        acceptable_units.extend(alternative_units[standard_name])
-
-                    if units not in acceptable_units:
-                        if len(acceptable_units) == 1:
-                            result.errors.append(
-                                f"Variable {var_name} (standard_name='{standard_name}'): Non-compliant units '{units}', expected '{expected_units}'"
-                            )
-                        else:
-                            result.errors.append(
-                                f"Variable {var_name} (standard_name='{standard_name}'): Non-compliant units '{units}', expected one of {acceptable_units}"
-                            )
-
-                # If standard_name not in our approved list, just issue a warning
-                elif standard_name not in approved_units:
-                    result.warnings.append(
-                        f"Variable {var_name}: Unknown standard_name '{standard_name}' - cannot validate units '{units}'"
+                        f"Variable {var_name} (standard_name='{standard_name}'): Non-compliant units '{units}', expected one of {list(acceptable_units)}"
                     )
 
     def _validate_global_attributes(self, ds: xr.Dataset, result: ValidationResult):
         """Validate global attributes (generic and array-specific)."""
+        # Snapshot the attributes once; the checks below only need a plain dict
+        attrs = dict(ds.attrs)
+
         # Generic global attribute checks
-        self._validate_generic_global_attributes(ds, result)
+        self._validate_generic_global_attributes(attrs, result)
 
         # Array-specific global attribute checks
-        self._validate_array_specific_global_attributes(ds, result)
+        self._validate_array_specific_global_attributes(attrs, result)
 
         # Additional validations
-        self._validate_additional_global_attributes(ds, result)
+        self._validate_additional_global_attributes(attrs, result)
 
     def _validate_generic_global_attributes(
-        self, ds: xr.Dataset, result: ValidationResult
+        self, attrs: dict, result: ValidationResult
     ):
         """Validate generic global attributes required for all AC1 files."""
-        # Check required attributes
-        for attr in self.generic_specs["required_global_attrs"]:
-            if attr not in ds.attrs:
-                result.errors.append(f"Missing required global attribute: {attr}")
+        # Check required attributes (reported in specification order)
+        missing = _REQUIRED_GLOBAL_ATTRS.difference(attrs)
+        if missing:
+            result.errors.extend(
+                f"Missing required global attribute: {attr}"
+                for attr in self.generic_specs["required_global_attrs"]
+                if attr in missing
+            )
 
         # Check conventions
-        if "Conventions" in ds.attrs:
-            conventions = ds.attrs["Conventions"]
-            for conv in self.generic_specs["required_conventions"]:
+        if "Conventions" in attrs:
+            conventions = attrs["Conventions"]
+            for conv in _REQUIRED_CONVENTIONS:
                 if conv not in conventions:
                     result.errors.append(f"Conventions must include '{conv}'")
 
     def _validate_array_specific_global_attributes(
-        self, ds: xr.Dataset, result: ValidationResult
+        self, attrs: dict, result: ValidationResult
     ):
         """Validate array-specific global attributes."""
         # Check array-specific values
-        if (
-            "site_code" in ds.attrs
-            and ds.attrs["site_code"] != self.array_specs["site_code"]
-        ):
-            result.errors.append(
-                f"site_code must be '{self.array_specs['site_code']}' for {self.array_specs['site_code']} data"
-            )
-
-        if "array" in ds.attrs and ds.attrs["array"] != self.array_specs["array"]:
-            result.errors.append(
-                f"array must be '{self.array_specs['array']}' for {self.array_specs['array']} data"
-            )
-
-        if (
-            "data_mode" in ds.attrs
-            and ds.attrs["data_mode"] != self.array_specs["data_mode"]
-        ):
-            result.errors.append(
-                f"data_mode must be '{self.array_specs['data_mode']}' for {self.array_specs['site_code']} data"
-            )
+        for attr, expected, data_label in self._array_scalar_checks:
+            if attr in attrs and attrs[attr] != expected:
+                result.errors.append(
+                    f"{attr} must be '{expected}' for {data_label} data"
+                )
 
     def _validate_additional_global_attributes(
-        self, ds: xr.Dataset, result: ValidationResult
+        self, attrs: dict, result: ValidationResult
     ):
         """Validate additional global attribute requirements."""
         # Check time format deviation
         for time_attr in ["time_coverage_start", "time_coverage_end"]:
-            if time_attr in ds.attrs:
-                time_str = ds.attrs[time_attr]
-                if not re.match(r"\d{8}T\d{6}$", time_str):
+            if time_attr in attrs:
+                time_str = attrs[time_attr]
+                if not _TIME_COVERAGE_RE.fullmatch(time_str):
                     result.errors.append(f"{time_attr} must use format YYYYmmddTHHMMss")
 
         # Check contributor role vocabulary (warning for non-standard, error for invalid URL)
-        if "contributor_role_vocabulary" in ds.attrs:
-            vocab_url = ds.attrs["contributor_role_vocabulary"]
+        if "contributor_role_vocabulary" in attrs:
+            vocab_url = attrs["contributor_role_vocabulary"]
             expected_url = "https://vocab.nerc.ac.uk/collection/W08/current/"
 
             # Check if it's a valid URL format
@@ -657,132 +1004,129 @@ class AC1ComplianceChecker:
                 )
 
         # Check contributor_id format (flexible for different ID types)
-        if "contributor_id" in ds.attrs:
-            id_str = ds.attrs["contributor_id"]
-            ids = [id_val.strip() for id_val in id_str.split(",")]
-            for id_val in ids:
+        if "contributor_id" in attrs:
+            id_str = attrs["contributor_id"]
+            for id_val in _CSV_SPLIT_RE.split(id_str.strip()):
                 # If it claims to be ORCID, validate the format
-                if "orcid.org" in id_val.lower():
-                    if not re.match(
-                        r"https://orcid\.org/\d{4}-\d{4}-\d{4}-\d{3}[0-9X]$", id_val
-                    ):
+                if _ORCID_HINT_RE.search(id_val):
+                    if not _ORCID_RE.fullmatch(id_val):
                         result.errors.append(
                             f"Invalid ORCID format: {id_val}. Must be https://orcid.org/XXXX-XXXX-XXXX-XXXX"
                         )
                 # For other ID types, just check it's not empty and contains some structure
-                elif not id_val or len(id_val.strip()) < 3:
+                elif len(id_val) < 3:
                     result.errors.append(
                         f"contributor_id entries must be meaningful identifiers, got: '{id_val}'"
                     )
 
         # Validate new mandatory OceanSITES attributes
         # Check data_mode values
-        if "data_mode" in ds.attrs:
-            valid_data_modes = ["R", "P", "D"]  # Real-time, Provisional, Delayed
-            if ds.attrs["data_mode"] not in valid_data_modes:
+        if "data_mode" in attrs:
+            if attrs["data_mode"] not in _VALID_DATA_MODES:
                 result.errors.append(
-                    f"data_mode must be one of {valid_data_modes}, got '{ds.attrs['data_mode']}'"
+                    f"data_mode must be one of {list(_VALID_DATA_MODES)}, got '{attrs['data_mode']}'"
                 )
 
         # Check QC_indicator values
-        if "QC_indicator" in ds.attrs:
-            valid_qc_indicators = ["unknown", "excellent", "probably good", "mixed"]
-            if ds.attrs["QC_indicator"] not in valid_qc_indicators:
+        if "QC_indicator" in attrs:
+            if attrs["QC_indicator"] not in _VALID_QC_INDICATORS:
                 result.errors.append(
-                    f"QC_indicator must be one of {valid_qc_indicators}, got '{ds.attrs['QC_indicator']}'"
+                    f"QC_indicator must be one of {list(_VALID_QC_INDICATORS)}, got '{attrs['QC_indicator']}'"
                 )
 
         # Check cdm_data_type values
-        if "cdm_data_type" in ds.attrs:
-            valid_cdm_types = [
-                "TimeSeries",
-                "TimeSeriesProfile",
-                "Trajectory",
-                "TrajectoryProfile",
-                "Profile",
-            ]
-            if ds.attrs["cdm_data_type"] not in valid_cdm_types:
+        if "cdm_data_type" in attrs:
+            if attrs["cdm_data_type"] not in _VALID_CDM_TYPES:
                 result.errors.append(
-                    f"cdm_data_type must be one of {valid_cdm_types}, got '{ds.attrs['cdm_data_type']}'"
+                    f"cdm_data_type must be one of {list(_VALID_CDM_TYPES)}, got '{attrs['cdm_data_type']}'"
                 )
 
         # Check date_created format (use same compact format as time_coverage)
-        if "date_created" in ds.attrs:
-            date_str = ds.attrs["date_created"]
-            if not re.match(r"\d{8}T\d{6}$", date_str):
+        if "date_created" in attrs:
+            date_str = attrs["date_created"]
+            if not _TIME_COVERAGE_RE.fullmatch(date_str):
                 result.errors.append(
                     f"date_created must use format YYYYmmddTHHMMss, got '{date_str}'"
                 )
 
         # Check id format (should match filename pattern)
-        if "id" in ds.attrs:
-            id_str = ds.attrs["id"]
-            if not re.match(
-                r"^OS_[A-Z0-9]+_\d{8}-\d{8}_[A-Z]{3}_[A-Za-z0-9_T]+$", id_str
-            ):
+        if "id" in attrs:
+            id_str = attrs["id"]
+            if not _ID_RE.fullmatch(id_str):
                 result.warnings.append(
                     f"id should follow OceanSITES pattern OS_ARRAY_YYYYMMDD-YYYYMMDD_TYPE_CONTENT, got '{id_str}'"
                 )
 
     def _validate_data_values(
-        self, ds: xr.Dataset, filepath: str, result: ValidationResult
+        self,
+        ds: xr.Dataset,
+        filepath: str,
+        result: ValidationResult,
+        filename_match: Optional[re.Match] = None,
     ):
         """Validate actual data values."""
         # Extract date range from filename
-        filename = Path(filepath).name
-        general_match = re.match(
-            self.generic_specs["general_filename_pattern"], filename
-        )
+        general_match = filename_match or _FILENAME_RE.fullmatch(Path(filepath).name)
         if not general_match:
             return  # Skip if can't parse filename
 
-        start_date = datetime.strptime(general_match.group(2), "%Y%m%d")
-        end_date = datetime.strptime(general_match.group(3), "%Y%m%d")
+        start_date = _parse_yyyymmdd(general_match.group(2))
+        end_date = _parse_yyyymmdd(general_match.group(3))
 
         # Validate coordinate values using generic specs
-        for coord_name, coord_spec in self.generic_specs["coordinate_specs"].items():
-            if coord_name in ds.coords:
-                coord_vals = ds[coord_name].values
+        for coord_name, value_range, positive_down_range in self._coord_specs:
+            if coord_name not in ds.variables:
+                continue
 
-                # Check value ranges
-                if "range" in coord_spec:
-                    min_val, max_val = coord_spec["range"]
-                    if np.any((coord_vals < min_val) | (coord_vals > max_val)):
-                        result.errors.append(
-                            f"{coord_name} values must be between {min_val} and {max_val}"
-                        )
+            # Check value ranges
+            if value_range is not None:
+                min_val, max_val = value_range
+                coord_min, coord_max = _nan_bounds(_masked_values(ds[coord_name]))
+                if coord_min < min_val or coord_max > max_val:
+                    result.errors.append(
+                        f"{coord_name} values must be between {min_val} and {max_val}"
+                    )
+
+            # Check depth positive direction
+            elif coord_name == "DEPTH" and positive_down_range is not None:
+                depth_var = ds[coord_name]
+                positive = depth_var.attrs.get("positive", "down")
+                coord_min, coord_max = _nan_bounds(_masked_values(depth_var))
 
-                # Check depth positive direction
-                elif coord_name == "DEPTH" and "positive_down_range" in coord_spec:
-                    depth_var = ds[coord_name]
-                    positive = depth_var.attrs.get("positive", "down")
-
-                    if positive == "down":
-                        min_val, max_val = coord_spec["positive_down_range"]
-                        if np.any(coord_vals < min_val):
-                            result.errors.append(
-                                f"DEPTH values must be ≥{min_val} when positive='down'"
-                            )
-                    elif positive == "up" and np.any(coord_vals > 0):
+                if positive == "down":
+                    min_val, max_val = positive_down_range
+                    if coord_min < min_val:
                         result.errors.append(
-                            "DEPTH values must be ≤0 when positive='up'"
+                            f"DEPTH values must be ≥{min_val} when positive='down'"
                         )
+                elif positive == "up" and coord_max > 0:
+                    result.errors.append("DEPTH values must be ≤0 when positive='up'")
 
         # Validate TIME values against filename date range
-        if "TIME" in ds.coords:
+        if "TIME" in ds.variables:
             time_var = ds["TIME"]
-            if "units" in time_var.attrs:
+            is_decoded = np.issubdtype(time_var.dtype, np.datetime64)
+            if is_decoded or "units" in time_var.attrs:
                 try:
-                    # Convert to datetime
-                    time_values = xr.decode_cf(ds)["TIME"].values
+                    if is_decoded:
+                        # Already datetime64 (e.g. an in-memory dataset)
+                        time_bounds = _nan_bounds(np.asarray(time_var.values))
+                    else:
+                        from xarray.coding.times import decode_cf_datetime
+
+                        # The encoding is linear in time, so only the raw
+                        # extremes need converting to datetime
+                        time_bounds = decode_cf_datetime(
+                            np.array(_nan_bounds(_masked_values(time_var))),
+                            time_var.attrs["units"],
+                            time_var.attrs.get("calendar", "standard"),
+                        )
                     file_start = np.datetime64(start_date)
                     file_end = np.datetime64(
                         end_date + timedelta(days=1)
                     )  # End of end date
 
-                    if np.any(time_values < file_start) or np.any(
-                        time_values >= file_end
-                    ):
+                    if time_bounds[0] < file_start or time_bounds[1] >= file_end:
                         result.errors.append(
                             "TIME values must fall within filename date range"
                         )
@@ -792,21 +1136,56 @@ class AC1ComplianceChecker:
                     )
 
         # Check valid_min/valid_max for variables that specify them
-        for var_name, var in ds.data_vars.items():
-            if "valid_min" in var.attrs and "valid_max" in var.attrs:
-                valid_min = var.attrs["valid_min"]
-                valid_max = var.attrs["valid_max"]
-
-                # Only check non-NaN values
-                valid_data = var.values[~np.isnan(var.values)]
-                if len(valid_data) > 0:
-                    if np.any(valid_data < valid_min) or np.any(valid_data > valid_max):
-                        result.warnings.append(
-                            f"Variable {var_name} has values outside valid range [{valid_min}, {valid_max}]"
-                        )
+        ranged = [
+            (name, var.attrs["valid_min"], var.attrs["valid_max"], _masked_values(var))
+            for name, var in ds.data_vars.items()
+            if "valid_min" in var.attrs and "valid_max" in var.attrs
+        ]
+
+        # Stack numeric variables of the same shape so each group needs a single
+        # min and max reduction; anything else is reduced on its own below
+        by_shape = {}
+        for i, (_, _, _, values) in enumerate(ranged):
+            if values.size and values.dtype.kind in "fiu":
+                by_shape.setdefault(values.shape, []).append(i)
+
+        bounds = {}
+        for indices in by_shape.values():
+            block = np.stack([ranged[i][3] for i in indices])
+            axes = tuple(range(1, block.ndim))
+            block_min = np.fmin.reduce(block, axis=axes)
+            block_max = np.fmax.reduce(block, axis=axes)
+            bounds.update(zip(indices, zip(block_min, block_max)))
+
+        for i, (var_name, valid_min, valid_max, values) in enumerate(ranged):
+            # Only check non-NaN values
+            data_min, data_max = bounds[i] if i in bounds else _nan_bounds(values)
+            if data_min < valid_min or data_max > valid_max:
+                result.warnings.append(
+                    f"Variable {var_name} has values outside valid range [{valid_min}, {valid_max}]"
+                )
+
+
+# Per-process checker used by AC1ComplianceChecker.validate_files
+_worker_checker = None
+_worker_use_xarray = False
+
 
+def _init_validation_worker(checker_cls: type, array_specs, use_xarray: bool) -> None:
+    """Create the checker once per worker process."""
+    global _worker_checker, _worker_use_xarray
+    _worker_checker = checker_cls(array_specs)
+    _worker_use_xarray = use_xarray
 
-def validate_ac1_file(filepath: str, array_specs=None) -> ValidationResult:
+
+def _validate_in_worker(filepath: str) -> ValidationResult:
+    """Validate one file with the worker process's checker."""
+    return _worker_checker.validate_file(filepath, use_xarray=_worker_use_xarray)
+
+
+def validate_ac1_file(
+    filepath: str, array_specs=None, use_xarray: bool = False
+) -> ValidationResult:
     """Convenience function to validate an AC1 file.
 
     Parameters
@@ -815,6 +1194,8 @@ def validate_ac1_file(filepath: str, array_specs=None) -> ValidationResult:
         Path to the NetCDF file to validate
     array_specs : dict, optional
         Array-specific specifications. Defaults to RAPID_SPECS.
+    use_xarray : bool, optional
+        If True, open the file with xarray instead of netCDF4. Default is False.
 
     Returns
     -------
@@ -823,7 +1204,42 @@ def validate_ac1_file(filepath: str, array_specs=None) -> ValidationResult:
 
     """
     checker = AC1ComplianceChecker(array_specs)
-    return checker.validate_file(filepath)
+    return checker.validate_file(filepath, use_xarray=use_xarray)
+
+
+def validate_ac1_dataset(
+    ds: xr.Dataset, filename: str, array_specs=None
+) -> ValidationResult:
+    """Convenience function to validate an in-memory AC1 dataset.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Dataset to validate
+    filename : str
+        File name the dataset would be saved under
+    array_specs : dict, optional
+        Array-specific specifications. Defaults to RAPID_SPECS.
+
+    Returns
+    -------
+    ValidationResult
+        Validation results
+
+    """
+    checker = AC1ComplianceChecker(array_specs)
+    return checker.validate_dataset(ds, filename)
+
+
+# Separators for print_validation_report
+_REPORT_RULE = "=" * 60
+_REPORT_ERRORS_HEADER = f"{'-' * 30} ERRORS {'-' * 30}"
+_REPORT_WARNINGS_HEADER = f"{'-' * 29} WARNINGS {'-' * 29}"
+
+
+def _numbered_lines(messages: List[str]) -> str:
+    """Format messages as a numbered list, one per line, for a single write."""
+    return "".join(f"{i:2d}. {message}\n" for i, message in enumerate(messages, 1))
 
 
 def print_validation_report(result: ValidationResult, filepath: str):
@@ -837,9 +1253,9 @@ def print_validation_report(result: ValidationResult, filepath: str):
         Path to the validated file
 
     """
-    print(f"\n{'='*60}")
+    print(f"\n{_REPORT_RULE}")
     print(f"AC1 Compliance Report: {Path(filepath).name}")
-    print(f"{'='*60}")
+    print(_REPORT_RULE)
 
     if result.file_type:
         print(f"File Type: {result.file_type}")
@@ -849,16 +1265,14 @@ def print_validation_report(result: ValidationResult, filepath: str):
     print(f"Warnings: {len(result.warnings)}")
 
     if result.errors:
-        print(f"\n{'-'*30} ERRORS {'-'*30}")
-        for i, error in enumerate(result.errors, 1):
-            print(f"{i:2d}. {error}")
+        print(f"\n{_REPORT_ERRORS_HEADER}")
+        sys.stdout.write(_numbered_lines(result.errors))
 
     if result.warnings:
-        print(f"\n{'-'*29} WARNINGS {'-'*29}")
-        for i, warning in enumerate(result.warnings, 1):
-            print(f"{i:2d}. {warning}")
+        print(f"\n{_REPORT_WARNINGS_HEADER}")
+        sys.stdout.write(_numbered_lines(result.warnings))
 
-    print(f"\n{'='*60}")
+    print(f"\n{_REPORT_RULE}")
 
 
 def create_array_specs_template():
@@ -875,6 +1289,10 @@ def create_array_specs_template():
             "file_type_1": r"^OS_ARRAY_(\d{8})-(\d{8})_DPR_content_TRES\.nc$",
             # Add more file types as needed
         },
+        "partx_to_type": {
+            ("DPR", "content_TRES"): "file_type_1",
+            # Optional: (ContentType, PARTX) lookup used instead of file_patterns
+        },
         "site_code": "ARRAY_NAME",
         "array": "ARRAY_NAME",
         "data_mode": "D",  # or 'R' for real-time
@@ -6,21 +6,108 @@ following OceanSITES conventions and AC1 specifications.
 
 import xarray as xr
 import numpy as np
-from datetime import datetime
+import time
+from itertools import islice
+from types import MappingProxyType
 from typing import Dict, List, Tuple
 
 from amocatlas import logger
 
 log = logger.log
 
+# Accepted spellings of transport units, mapped to the AC1 standard form
+_TRANSPORT_UNITS_CANONICAL = {
+    "sverdrup": "sverdrup",
+    "Sv": "sverdrup",
+    "Sverdrup": "sverdrup",
+}
 
-# Contributor ORCID lookup table
-# Maps (array_name, contributor_name) tuples to ORCID identifiers
-CONTRIBUTOR_ORCID_LOOKUP = {
+# Arrays recognised by _determine_array_name
+_KNOWN_ARRAYS = frozenset(("RAPID", "OSNAP", "MOVE", "SAMBA"))
+# (source_file substring, array name), checked in order
+_ARRAY_FROM_FILENAME = (
+    ("rapid", "RAPID"),
+    ("osnap", "OSNAP"),
+    ("move", "MOVE"),
+    ("samba", "SAMBA"),
+)
+
+# RAPID transport variable mapping, in N_COMPONENT order
+_RAPID_TRANSPORT_MAPPING = {
+    "t_gs10": {
+        "name": "Florida Straits",
+        "description": "Florida Straits transport",
+    },
+    "t_ek10": {"name": "Ekman", "description": "Ekman transport"},
+    "t_umo10": {
+        "name": "Upper Mid-Ocean",
+        "description": "Upper Mid-Ocean transport",
+    },
+    "t_therm10": {
+        "name": "Thermocline",
+        "description": "Thermocline recirculation 0-800m",
+    },
+    "t_aiw10": {
+        "name": "Intermediate Water",
+        "description": "Intermediate water 800-1100m",
+    },
+    "t_ud10": {"name": "Upper NADW", "description": "Upper NADW 1100-3000m"},
+    "t_ld10": {"name": "Lower NADW", "description": "Lower NADW 3000-5000m"},
+    "t_bw10": {"name": "AABW", "description": "AABW >5000m"},
+}
+
+# Global attributes shared by every AC1 dataset
+_AC1_BASE_ATTRS = MappingProxyType(
+    {
+        "Conventions": "CF-1.8, OceanSITES-1.4, ACDD-1.3",
+        "format_version": "1.4",
+        "data_type": "OceanSITES time-series data",
+        "featureType": "timeSeries",
+        "data_mode": "D",  # Delayed mode
+        # Default contributor role vocabulary
+        "contributor_role_vocabulary": "https://vocab.nerc.ac.uk/collection/W08/current/",
+        "processing_level": "Data verified against model or other contextual information",
+        "naming_authority": "AMOCatlas",
+        "cdm_data_type": "TimeSeries",
+        "QC_indicator": "excellent",  # no known problems, all important QC done
+    }
+)
+
+# Geographic bounds and platform for RAPID 26°N
+_RAPID_GEOSPATIAL_ATTRS = MappingProxyType(
+    {
+        "geospatial_lat_min": 26.5,
+        "geospatial_lat_max": 26.5,
+        "geospatial_lon_min": -79.0,  # Approximate western boundary
+        "geospatial_lon_max": -13.0,  # Approximate eastern boundary
+        "platform_code": "RAPID26N",  # Unique platform identifier
+    }
+)
+
+# Contributor attributes copied from the source dataset
+_CONTRIBUTOR_ATTRS = (
+    "contributor_name",
+    "contributor_email",
+    "contributor_id",
+    "contributor_role",
+    "contributing_institutions",
+    "contributing_institutions_vocabulary",
+    "contributing_institutions_role",
+    "contributing_institutions_role_vocabulary",
+)
+
+# Contributor ORCIDs, one entry per (array_name, contributor_name)
+_RAW_CONTRIBUTOR_ORCIDS = {
     ("RAPID", "Ben Moat"): "https://orcid.org/0000-0001-8676-7779",
-    ("rapid", "Ben Moat"): "https://orcid.org/0000-0001-8676-7779",
     ("RAPID", "Ben I. Moat"): "https://orcid.org/0000-0001-8676-7779",
-    ("rapid", "Ben I. Moat"): "https://orcid.org/0000-0001-8676-7779",
+}
+
+# Contributor ORCID lookup table
+# Maps (ARRAY_NAME, contributor_name) tuples to ORCID identifiers; array names
+# are upper-cased so lookups are case-insensitive in the array name
+CONTRIBUTOR_ORCID_LOOKUP = {
+    (array.upper(), name.strip()): orcid
+    for (array, name), orcid in _RAW_CONTRIBUTOR_ORCIDS.items()
 }
 
 
@@ -47,20 +134,18 @@ def enrich_contributor_ids(attrs: Dict, array_name: str = None) -> Dict:
     names = [name.strip() for name in attrs["contributor_name"].split(",")]
 
     # Look up ORCIDs for each contributor
+    array_key = array_name.upper()
     orcids = []
     for name in names:
-        # Try exact match first
-        lookup_key = (array_name, name)
-        if lookup_key in CONTRIBUTOR_ORCID_LOOKUP:
-            orcids.append(CONTRIBUTOR_ORCID_LOOKUP[lookup_key])
-            logger.log_info(
-                f"Found ORCID for {name} in {array_name}: {CONTRIBUTOR_ORCID_LOOKUP[lookup_key]}"
-            )
+        orcid = CONTRIBUTOR_ORCID_LOOKUP.get((array_key, name))
+        if orcid:
+            orcids.append(orcid)
+            logger.log_info("Found ORCID for %s in %s: %s", name, array_name, orcid)
         else:
             # No match found, use empty string as placeholder
             orcids.append("")
             logger.log_warning(
-                f"No ORCID found for contributor '{name}' in array '{array_name}'"
+                "No ORCID found for contributor '%s' in array '%s'", name, array_name
             )
 
     # Update contributor_id field
@@ -127,22 +212,17 @@ def to_AC1(
 def _determine_array_name(ds: xr.Dataset) -> str:
     """Determine array name from dataset attributes."""
     # Check common attribute names
-    for attr in ["array", "platform", "site_code"]:
+    for attr in ("array", "platform", "site_code"):
         if attr in ds.attrs:
             value = ds.attrs[attr].upper()
-            if value in ["RAPID", "OSNAP", "MOVE", "SAMBA"]:
+            if value in _KNOWN_ARRAYS:
                 return value
 
     # Check source file name
-    source_file = ds.attrs.get("source_file", "")
-    if "rapid" in source_file.lower():
-        return "RAPID"
-    elif "osnap" in source_file.lower():
-        return "OSNAP"
-    elif "move" in source_file.lower():
-        return "MOVE"
-    elif "samba" in source_file.lower():
-        return "SAMBA"
+    source_file = ds.attrs.get("source_file", "").lower()
+    for needle, array_name in _ARRAY_FROM_FILENAME:
+        if needle in source_file:
+            return array_name
 
     # Default fallback
     log.warning("Could not determine array name, defaulting to 'RAPID'")
@@ -151,26 +231,28 @@ def _determine_array_name(ds: xr.Dataset) -> str:
 
 def _determine_date_range(ds: xr.Dataset) -> Tuple[str, str]:
     """Determine date range from dataset time coordinate."""
-    time_coord = ds["TIME"]
-
-    # Convert to pandas datetime for easier handling
-    time_pd = time_coord.to_pandas()
-    start_dt = time_pd.iloc[0]
-    end_dt = time_pd.iloc[-1]
+    # Only the endpoints are needed, so format them directly
+    endpoints = ds["TIME"].values[[0, -1]]
 
-    start_date = start_dt.strftime("%Y%m%d")
-    end_date = end_dt.strftime("%Y%m%d")
+    if np.issubdtype(endpoints.dtype, np.datetime64):
+        start_date, end_date = (
+            day.replace("-", "") for day in np.datetime_as_string(endpoints, unit="D")
+        )
+    else:
+        # Non-standard calendars decode to cftime objects
+        start_date, end_date = (t.strftime("%Y%m%d") for t in endpoints)
 
     return start_date, end_date
 
 
 def _is_component_transport_data(ds: xr.Dataset) -> bool:
     """Check if dataset contains component transport data."""
-    # Look for transport variables with specific naming patterns
-    transport_vars = [
+    # Look for transport variables with specific naming patterns, stopping
+    # once enough are found (RAPID has 8-9 transport components)
+    transport_vars = (
         var for var in ds.data_vars if "t_" in var or "transport" in var.lower()
-    ]
-    return len(transport_vars) >= 6  # RAPID has 8-9 transport components
+    )
+    return sum(1 for _ in islice(transport_vars, 6)) == 6
 
 
 def _convert_component_transports(
@@ -179,42 +261,14 @@ def _convert_component_transports(
     """Convert dataset to AC1 component transports format."""
     log.info(f"Converting to component transports format for {array_name}")
 
-    # Define RAPID transport variable mapping
-    transport_mapping = {
-        "t_gs10": {
-            "name": "Florida Straits",
-            "description": "Florida Straits transport",
-        },
-        "t_ek10": {"name": "Ekman", "description": "Ekman transport"},
-        "t_umo10": {
-            "name": "Upper Mid-Ocean",
-            "description": "Upper Mid-Ocean transport",
-        },
-        "t_therm10": {
-            "name": "Thermocline",
-            "description": "Thermocline recirculation 0-800m",
-        },
-        "t_aiw10": {
-            "name": "Intermediate Water",
-            "description": "Intermediate water 800-1100m",
-        },
-        "t_ud10": {"name": "Upper NADW", "description": "Upper NADW 1100-3000m"},
-        "t_ld10": {"name": "Lower NADW", "description": "Lower NADW 3000-5000m"},
-        "t_bw10": {"name": "AABW", "description": "AABW >5000m"},
-    }
-
     # Get available transport variables
-    available_transports = {
-        var: transport_mapping[var] for var in transport_mapping if var in ds.data_vars
-    }
+    component_names = [var for var in _RAPID_TRANSPORT_MAPPING if var in ds.data_vars]
 
-    if not available_transports:
+    if not component_names:
         raise ValueError("No recognized transport variables found in dataset")
 
-    n_components = len(available_transports)
-    log.info(
-        f"Found {n_components} transport components: {list(available_transports.keys())}"
-    )
+    n_components = len(component_names)
+    log.info(f"Found {n_components} transport components: {component_names}")
 
     # Create new dataset structure
     ac1_ds = xr.Dataset()
@@ -256,7 +310,6 @@ def _convert_component_transports(
     )
 
     # Create N_COMPONENT dimension and coordinate
-    component_names = list(available_transports.keys())
     ac1_ds["N_COMPONENT"] = xr.DataArray(
         np.arange(n_components),
         dims=["N_COMPONENT"],
@@ -268,38 +321,34 @@ def _convert_component_transports(
     )
 
     # Create TRANSPORT variable (N_COMPONENT, TIME) - validate units from standardise.py
-    transport_data_list = []
-    expected_units = "sverdrup"
+    # Rows are written in place, so allocate the full block once
+    transport_data = np.empty(
+        (n_components, ds.sizes["TIME"]),
+        dtype=np.result_type(*(ds[var].dtype for var in component_names)),
+    )
+    transport_names = []
+    transport_descriptions = []
 
-    # Validate that all transport variables have the expected units
-    for var in component_names:
+    # Validate that all transport variables have the expected units, filling
+    # the data rows and component names/descriptions in the same pass
+    for i, var in enumerate(component_names):
         current_units = ds[var].attrs.get("units")
         if current_units is None:
             raise ValueError(
                 f"Variable {var} is missing units attribute. Units should be assigned in standardise.py"
             )
 
-        # Check for acceptable transport units (should be standardized in standardise.py)
-        acceptable_units = [
-            "sverdrup",
-            "Sv",
-            "Sverdrup",
-        ]  # Different acceptable formats
-        if current_units not in acceptable_units:
+        # Check for acceptable transport units (should be standardized in standardise.py);
+        # all of them map to "sverdrup", so only the unit label changes, not values
+        if current_units not in _TRANSPORT_UNITS_CANONICAL:
             raise ValueError(
-                f"Variable {var} has units '{current_units}' but expected one of {acceptable_units}. Units should be standardized in standardise.py"
+                f"Variable {var} has units '{current_units}' but expected one of {list(_TRANSPORT_UNITS_CANONICAL)}. Units should be standardized in standardise.py"
             )
 
-        # Convert to AC1 standard if needed (only unit format changes, not values)
-        var_data = ds[var].values
-        if current_units in ["Sv", "Sverdrup"]:
-            final_units = "sverdrup"  # AC1 standard format
-        else:
-            final_units = current_units
-
-        transport_data_list.append(var_data)
+        transport_data[i] = ds[var].values
+        transport_names.append(_RAPID_TRANSPORT_MAPPING[var]["name"])
+        transport_descriptions.append(_RAPID_TRANSPORT_MAPPING[var]["description"])
 
-    transport_data = np.array(transport_data_list)
     ac1_ds["TRANSPORT"] = xr.DataArray(
         transport_data,
         dims=["N_COMPONENT", "TIME"],
@@ -325,9 +374,9 @@ def _convert_component_transports(
                 "Variable moc_mar_hc10 is missing units attribute. Units should be assigned in standardise.py"
             )
 
-        if current_units not in acceptable_units:
+        if current_units not in _TRANSPORT_UNITS_CANONICAL:
             raise ValueError(
-                f"Variable moc_mar_hc10 has units '{current_units}' but expected one of {acceptable_units}. Units should be standardized in standardise.py"
+                f"Variable moc_mar_hc10 has units '{current_units}' but expected one of {list(_TRANSPORT_UNITS_CANONICAL)}. Units should be standardized in standardise.py"
             )
 
         ac1_ds["MOC_TRANSPORT"] = xr.DataArray(
@@ -345,7 +394,6 @@ def _convert_component_transports(
         )
 
     # Create TRANSPORT_NAME variable (string data, dimensionless)
-    transport_names = [available_transports[var]["name"] for var in component_names]
     ac1_ds["TRANSPORT_NAME"] = xr.DataArray(
         transport_names,
         dims=["N_COMPONENT"],
@@ -357,9 +405,6 @@ def _convert_component_transports(
     )
 
     # Create TRANSPORT_DESCRIPTION variable (string data, dimensionless)
-    transport_descriptions = [
-        available_transports[var]["description"] for var in component_names
-    ]
     ac1_ds["TRANSPORT_DESCRIPTION"] = xr.DataArray(
         transport_descriptions,
         dims=["N_COMPONENT"],
@@ -382,69 +427,43 @@ def _create_ac1_global_attributes(
     ds: xr.Dataset, array_name: str, start_date: str, end_date: str, content_type: str
 ) -> Dict:
     """Create AC1-compliant global attributes."""
-    attrs = {}
-
-    # Required OceanSITES/CF/ACDD attributes
-    attrs["Conventions"] = "CF-1.8, OceanSITES-1.4, ACDD-1.3"
-    attrs["format_version"] = "1.4"
-    attrs["data_type"] = "OceanSITES time-series data"
-    attrs["featureType"] = "timeSeries"
-    attrs["data_mode"] = "D"  # Delayed mode
-
-    # Title and summary
-    attrs["title"] = (
-        f"{array_name} Atlantic Meridional Overturning Circulation Transport Components"
-    )
-    attrs["summary"] = (
-        f"Component transport time series from the {array_name} observing array measuring the Atlantic Meridional Overturning Circulation."
-    )
+    # Required OceanSITES/CF/ACDD attributes and other fixed metadata
+    attrs = dict(_AC1_BASE_ATTRS)
 
-    # Source and provenance
-    attrs["source"] = f"{array_name} moored array observations"
-    attrs["site_code"] = array_name
-    attrs["array"] = array_name
+    attrs.update(
+        {
+            # Title and summary
+            "title": f"{array_name} Atlantic Meridional Overturning Circulation Transport Components",
+            "summary": f"Component transport time series from the {array_name} observing array measuring the Atlantic Meridional Overturning Circulation.",
+            # Source and provenance
+            "source": f"{array_name} moored array observations",
+            "site_code": array_name,
+            "array": array_name,
+            # Time coverage
+            "time_coverage_start": f"{start_date}T000000",
+            "time_coverage_end": f"{end_date}T235959",
+            # Processing metadata
+            "date_created": time.strftime("%Y%m%dT%H%M%S", time.gmtime()),
+            "comment": f'Converted to AC1 format from {ds.attrs.get("source_file", "original data")} using amocatlas.convert.to_AC1()',
+            "id": f"OS_{array_name}_{start_date}-{end_date}_DPR_{content_type}",
+        }
+    )
 
     # Geographic bounds (RAPID 26°N for now)
     if array_name == "RAPID":
-        attrs["geospatial_lat_min"] = 26.5
-        attrs["geospatial_lat_max"] = 26.5
-        attrs["geospatial_lon_min"] = -79.0  # Approximate western boundary
-        attrs["geospatial_lon_max"] = -13.0  # Approximate eastern boundary
-        # Missing mandatory OceanSITES attributes
-        attrs["platform_code"] = "RAPID26N"  # Unique platform identifier
+        attrs.update(_RAPID_GEOSPATIAL_ATTRS)
     else:
         # Add geographic bounds for other arrays as needed
         attrs["platform_code"] = f"{array_name.upper()}_ARRAY"
 
-    # Time coverage
-    attrs["time_coverage_start"] = f"{start_date}T000000"
-    attrs["time_coverage_end"] = f"{end_date}T235959"
-
     # Copy contributor information from original dataset
-    contributor_attrs = [
-        "contributor_name",
-        "contributor_email",
-        "contributor_id",
-        "contributor_role",
-        "contributing_institutions",
-        "contributing_institutions_vocabulary",
-        "contributing_institutions_role",
-        "contributing_institutions_role_vocabulary",
-    ]
-
-    for attr in contributor_attrs:
-        if attr in ds.attrs:
-            attrs[attr] = ds.attrs[attr]
+    attrs.update(
+        {attr: ds.attrs[attr] for attr in _CONTRIBUTOR_ATTRS if attr in ds.attrs}
+    )
 
     # Enrich contributor information with ORCID identifiers
     attrs = enrich_contributor_ids(attrs, array_name)
 
-    # Set default contributor role vocabulary if not present
-    if "contributor_role_vocabulary" not in attrs:
-        attrs["contributor_role_vocabulary"] = (
-            "https://vocab.nerc.ac.uk/collection/W08/current/"
-        )
-
     # Source acknowledgement
     if "acknowledgement" in ds.attrs:
         attrs["source_acknowledgement"] = ds.attrs["acknowledgement"]
@@ -459,26 +478,8 @@ def _create_ac1_global_attributes(
     if "doi" in ds.attrs:
         attrs["doi"] = ds.attrs["doi"]
 
-    # Processing metadata
-    attrs["date_created"] = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-    attrs["processing_level"] = (
-        "Data verified against model or other contextual information"
-    )
-    attrs["comment"] = (
-        f'Converted to AC1 format from {ds.attrs.get("source_file", "original data")} using amocatlas.convert.to_AC1()'
-    )
-
-    # Additional mandatory OceanSITES attributes
-    attrs["naming_authority"] = "AMOCatlas"
-    attrs["id"] = f"OS_{array_name}_{start_date}-{end_date}_DPR_{content_type}"
-    attrs["cdm_data_type"] = "TimeSeries"
-
-    # Quality control attributes
-    attrs["QC_indicator"] = "excellent"  # no known problems, all important QC done
-
     # Institution information (if not already present)
-    if "institution" not in attrs:
-        attrs["institution"] = "AMOCatlas Community"
+    attrs.setdefault("institution", "AMOCatlas Community")
 
     return attrs
 
@@ -1,11 +1,23 @@
 """AMOCatlas plotting functions for visualization and publication figures."""
 
+from __future__ import annotations
+
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
 import matplotlib.pyplot as plt
 import pandas as pd
 import xarray as xr
 import numpy as np
 from pandas import DataFrame
-from pandas.io.formats.style import Styler
+
+if TYPE_CHECKING:
+    # Only needed for annotations; the styling module is loaded on first .style
+    from pandas.io.formats.style import Styler
 
 
 # ------------------------------------------------------------------------------------
@@ -82,55 +94,91 @@ def show_variables(data: str | xr.Dataset) -> Styler:
         If the input data is not a file path (str) or an xarray Dataset.
 
     """
-    from netCDF4 import Dataset
-    from pandas import DataFrame
-
     if isinstance(data, str):
         print(f"information is based on file: {data}")
-        dataset = Dataset(data)
-        variables = dataset.variables
+        vars = _show_variables_from_path(
+            os.path.abspath(data), os.stat(data).st_mtime_ns
+        ).copy()
     elif isinstance(data, xr.Dataset):
         print("information is based on xarray Dataset")
-        variables = data.variables
+        vars = _variables_frame(data.variables, from_netcdf4=False)
     else:
         raise TypeError("Input data must be a file path (str) or an xarray Dataset")
 
-    info = {}
-    for i, key in enumerate(variables):
-        var = variables[key]
-        if isinstance(data, str):
-            dims = var.dimensions[0] if len(var.dimensions) == 1 else "string"
-            units = "" if not hasattr(var, "units") else var.units
-            comment = "" if not hasattr(var, "comment") else var.comment
-        else:
-            dims = var.dims[0] if len(var.dims) == 1 else "string"
-            units = var.attrs.get("units", "")
-            comment = var.attrs.get("comment", "")
+    return vars.style
 
-        info[i] = {
-            "name": key,
-            "dims": dims,
+
+@lru_cache(maxsize=128)
+def _show_variables_from_path(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Variable table for a netCDF file, cached per path and modification time."""
+    from netCDF4 import Dataset
+
+    # Only metadata is read, so skip the mask/scale handling of variable data
+    with Dataset(path, "r", format="NETCDF4") as dataset:
+        dataset.set_auto_maskandscale(False)
+        return _variables_frame(dataset.variables, from_netcdf4=True)
+
+
+def _variables_frame(variables, from_netcdf4: bool) -> pd.DataFrame:
+    """Build the show_variables table from netCDF4 or xarray variables."""
+    # Collect each column in a single pass, then build the frame once
+    dims, names, units, comments, standard_names, dtypes = [], [], [], [], [], []
+    for key, var in variables.items():
+        if from_netcdf4:
+            var_dims = var.dimensions
+            # Test membership on ncattrs() rather than hasattr, which goes
+            # through netCDF4's __getattr__ fallback
+            ncattrs = set(var.ncattrs())
+            attrs = {
+                name: var.getncattr(name)
+                for name in ("units", "comment", "standard_name")
+                if name in ncattrs
+            }
+        else:
+            var_dims = var.dims
+            attrs = var.attrs
+
+        dims.append(var_dims[0] if len(var_dims) == 1 else "string")
+        names.append(key)
+        units.append(attrs.get("units", ""))
+        comments.append(attrs.get("comment", ""))
+        standard_names.append(attrs.get("standard_name", ""))
+        dtypes.append(str(var.dtype))
+
+    return _sorted_variables_frame(
+        {
+            "dims": _categorical_dims(dims),
+            "name": names,
             "units": units,
-            "comment": comment,
-            "standard_name": var.attrs.get("standard_name", ""),
-            "dtype": str(var.dtype) if isinstance(data, str) else str(var.data.dtype),
+            "comment": comments,
+            "standard_name": standard_names,
+            "dtype": dtypes,
         }
+    )
 
-    vars = DataFrame(info).T
 
-    dim = vars.dims
-    dim[dim.str.startswith("str")] = "string"
-    vars["dims"] = dim
+def _sorted_variables_frame(columns: dict[str, Any]) -> pd.DataFrame:
+    """Variable table sorted by dimension then name, indexed by name.
+
+    ``columns`` is already in display order and ``columns["dims"]`` is a
+    categorical with lexically ordered categories, so its codes sort like the
+    dimension names themselves.
+    """
+    order = np.lexsort((np.asarray(columns["name"], dtype=str), columns["dims"].codes))
+    return DataFrame(columns).take(order).set_index("name")
 
-    vars = (
-        vars.sort_values(["dims", "name"])
-        .reset_index(drop=True)
-        .loc[:, ["dims", "name", "units", "comment", "standard_name", "dtype"]]
-        .set_index("name")
-        .style
-    )
 
-    return vars
+def _categorical_dims(dims: list[str]) -> pd.Categorical:
+    """Dimension names as a categorical, labelling string-length dimensions "string".
+
+    The relabelling runs over the few unique categories rather than every
+    variable, and sorting on the result compares integer codes.
+    """
+    dims = pd.Categorical(dims)
+    labels = ["string" if dim.startswith("str") else dim for dim in dims.categories]
+    # Several string-length dimensions may collapse onto the same label
+    categories, codes = np.unique(np.asarray(labels, dtype=object), return_inverse=True)
+    return pd.Categorical.from_codes(codes[dims.codes], categories=categories)
 
 
 def show_attributes(data: str | xr.Dataset) -> pd.DataFrame:
@@ -156,29 +204,47 @@ def show_attributes(data: str | xr.Dataset) -> pd.DataFrame:
         If the input data is not a file path (str) or an xarray Dataset.
 
     """
-    from netCDF4 import Dataset
-    from pandas import DataFrame
-
     if isinstance(data, str):
         print(f"information is based on file: {data}")
-        rootgrp = Dataset(data, "r", format="NETCDF4")
-        attributes = rootgrp.ncattrs()
-        get_attr = lambda key: getattr(rootgrp, key)
+        attrs = _show_attributes_from_path(
+            os.path.abspath(data), os.stat(data).st_mtime_ns
+        ).copy()
     elif isinstance(data, xr.Dataset):
         print("information is based on xarray Dataset")
-        attributes = data.attrs.keys()
-        get_attr = lambda key: data.attrs[key]
+        attrs = _attributes_frame(data.attrs)
     else:
         raise TypeError("Input data must be a file path (str) or an xarray Dataset")
 
-    info = {}
-    for i, key in enumerate(attributes):
-        dtype = type(get_attr(key)).__name__
-        info[i] = {"Attribute": key, "Value": get_attr(key), "DType": dtype}
+    return attrs
 
-    attrs = DataFrame(info).T
 
-    return attrs
+@lru_cache(maxsize=128)
+def _show_attributes_from_path(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Attribute table for a netCDF file, cached per path and modification time."""
+    from netCDF4 import Dataset
+
+    with Dataset(path, "r", format="NETCDF4") as rootgrp:
+        # Read each attribute once with getncattr rather than through the
+        # __getattr__ fallback
+        return _attributes_frame(
+            {key: rootgrp.getncattr(key) for key in rootgrp.ncattrs()}
+        )
+
+
+def _attributes_frame(attributes: Mapping[str, Any]) -> pd.DataFrame:
+    """Build the show_attributes table from a mapping of attribute names to values."""
+    keys = list(attributes)
+    values = list(attributes.values())
+    dtypes = [type(value).__name__ for value in values]
+
+    # Values keep their own Python/numpy types rather than a common upcast
+    return DataFrame(
+        {
+            "Attribute": keys,
+            "Value": pd.Series(values, dtype=object),
+            "DType": dtypes,
+        }
+    )
 
 
 def show_variables_by_dimension(
@@ -212,79 +278,200 @@ def show_variables_by_dimension(
     """
     if isinstance(data, str):
         print(f"information is based on file: {data}")
-        dataset = xr.open_dataset(data)
-        variables = dataset.variables
+        # Skip CF decoding: only dimensions and attributes are needed
+        with xr.open_dataset(
+            data, decode_cf=False, mask_and_scale=False, decode_times=False
+        ) as dataset:
+            vars = _variables_by_dimension_frame(dataset.variables, dimension_name)
     elif isinstance(data, xr.Dataset):
         print("information is based on xarray Dataset")
-        variables = data.variables
+        vars = _variables_by_dimension_frame(data.variables, dimension_name)
     else:
         raise TypeError("Input data must be a file path (str) or an xarray Dataset")
 
-    info = {}
-    for i, key in enumerate(variables):
-        var = variables[key]
-        if isinstance(data, str):
-            dims = var.dimensions[0] if len(var.dimensions) == 1 else "string"
-            units = "" if not hasattr(var, "units") else var.units
-            comment = "" if not hasattr(var, "comment") else var.comment
-        else:
-            dims = var.dims[0] if len(var.dims) == 1 else "string"
-            units = var.attrs.get("units", "")
-            comment = var.attrs.get("comment", "")
-
-        if dims == dimension_name:
-            info[i] = {
-                "name": key,
-                "dims": dims,
-                "units": units,
-                "comment": comment,
-            }
+    return vars.style
+
+
+def _variables_by_dimension_frame(variables, dimension_name: str) -> pd.DataFrame:
+    """Build the show_variables_by_dimension table from xarray variables."""
+    # Collect each column in a single pass, then build the frame once
+    dims, names, units, comments = [], [], [], []
+    for key, var in variables.items():
+        dim = var.dims[0] if len(var.dims) == 1 else "string"
+        if dim == dimension_name:
+            attrs = var.attrs
+            dims.append(dim)
+            names.append(key)
+            units.append(attrs.get("units", ""))
+            comments.append(attrs.get("comment", ""))
+
+    return _sorted_variables_frame(
+        {
+            "dims": _categorical_dims(dims),
+            "name": names,
+            "units": units,
+            "comment": comments,
+        }
+    )
 
-    vars = DataFrame(info).T
 
-    dim = vars.dims
-    dim[dim.str.startswith("str")] = "string"
-    vars["dims"] = dim
+def _time_key(da: xr.DataArray) -> str:
+    """Return the name of the time coordinate of ``da``, ignoring case."""
+    coords = da.coords
+    # The standard spellings are a direct lookup; anything else needs a scan
+    for key in ("TIME", "time"):
+        if key in coords:
+            return key
+    for coord in coords:
+        if coord.lower() == "time":
+            return coord
+    raise ValueError("No time coordinate found.")
 
-    vars = (
-        vars.sort_values(["dims", "name"])
-        .reset_index(drop=True)
-        .loc[:, ["dims", "name", "units", "comment"]]
-        .set_index("name")
-        .style
-    )
 
-    return vars
+# Recently resampled arrays, most recent last. Entries keep the input array
+# alive so its id cannot be reused by another object while it is cached, so
+# the cache is bounded by the bytes it pins as well as by its entry count.
+_RESAMPLE_CACHE_SIZE = 32
+_RESAMPLE_CACHE_BYTES = 64 << 20
+_resample_cache: "OrderedDict[tuple, tuple[xr.DataArray, xr.DataArray]]" = OrderedDict()
 
 
 def monthly_resample(da: xr.DataArray) -> xr.DataArray:
-    """Resample to monthly mean if data is not already monthly."""
-    time_key = [c for c in da.coords if c.lower() == "time"]
-    if not time_key:
-        raise ValueError("No time coordinate found.")
-    time_key = time_key[0]
+    """Resample to monthly mean if data is not already monthly.
+
+    Results for recently seen arrays are cached by identity, shape and first
+    and last time value. Each call returns a shallow copy (or ``da`` itself
+    if it is already monthly), so callers may replace attributes freely, but
+    the values share memory with the cache: do not modify the result's
+    values in place. Likewise, values of ``da`` changed in place after a call
+    are not detected. Since the key includes the identity of ``da``, only
+    calls that pass the very same object again can hit; an array taken fresh
+    from a Dataset each time (``ds[name]``) never does, so resample that
+    once and reuse it.
+    """
+    time_key = _time_key(da)
+    time_values = da[time_key].values
+    if time_values.size == 0:
+        return _monthly_resample(da, time_key)
+
+    key = (
+        id(da),
+        da.shape,
+        time_key,
+        int(time_values[:1].view("i8")[0]),
+        int(time_values[-1:].view("i8")[0]),
+    )
+    cached = _resample_cache.get(key)
+    if cached is not None and cached[0] is da:
+        _resample_cache.move_to_end(key)
+        return _share_result(cached[1], da)
+
+    result = _monthly_resample(da, time_key)
+    _resample_cache[key] = (da, result)
+    # Drop the oldest entries until both bounds hold; an entry too large to
+    # fit on its own is not kept at all. Input that is already monthly is its
+    # own result, so its buffer is only counted once
+    while _resample_cache and (
+        len(_resample_cache) > _RESAMPLE_CACHE_SIZE
+        or sum(
+            a.nbytes + (0 if r is a else r.nbytes) for a, r in _resample_cache.values()
+        )
+        > _RESAMPLE_CACHE_BYTES
+    ):
+        _resample_cache.popitem(last=False)
+    return _share_result(result, da)
+
+
+def _share_result(result: xr.DataArray, da: xr.DataArray) -> xr.DataArray:
+    """Return a cached result without handing out the cached object itself.
+
+    Input that is already monthly is returned as is, since it belongs to the
+    caller anyway.
+    """
+    return result if result is da else result.copy(deep=False)
+
+
+# Number of evenly spaced gaps sampled by the quick "already monthly" check
+_MONTHLY_PROBE_GAPS = 8
 
-    # Extract time values and check spacing
+
+def _monthly_resample(da: xr.DataArray, time_key: str) -> xr.DataArray:
+    """Resample ``da`` to monthly means along ``time_key`` unless already monthly."""
     time_values = da[time_key].values
-    dt_days = np.nanmean(np.diff(time_values) / np.timedelta64(1, "D"))
+    n = len(time_values)
+
+    # Probe a handful of evenly spaced gaps first: when every sampled gap is
+    # monthly, treat the series as monthly without scanning the whole axis
+    if n >= 3:
+        idx = np.unique(np.linspace(0, n - 2, _MONTHLY_PROBE_GAPS, dtype=np.intp))
+        gaps = (time_values[idx + 1] - time_values[idx]) / np.timedelta64(1, "D")
+        if np.all((gaps >= 20) & (gaps <= 40)):
+            return da  # Already monthly
+
+    # Check the mean spacing. For a non-decreasing axis without NaT it is just
+    # the end-to-end span over the number of steps.
+    is_monotonic = (
+        n > 1
+        and not np.isnat(time_values[0])
+        and bool(np.all(np.diff(time_values.view("i8")) >= 0))
+    )
+    if is_monotonic:
+        dt_days = (time_values[-1] - time_values[0]) / np.timedelta64(1, "D") / (n - 1)
+    else:
+        dt_days = np.nanmean(np.diff(time_values) / np.timedelta64(1, "D"))
     if 20 <= dt_days <= 40:
         return da  # Already monthly
 
-    # Drop NaT timestamps
-    mask_valid_time = ~np.isnat(time_values)
-    da = da.isel({time_key: mask_valid_time})
-
-    # Drop duplicate timestamps (keep first)
-    _, unique_indices = np.unique(da[time_key].values, return_index=True)
-    da = da.isel({time_key: np.sort(unique_indices)})
+    # Drop NaT and duplicate timestamps (keep first) in a single selection
+    time_index = pd.Index(time_values)
+    da = da.isel({time_key: ~time_index.duplicated(keep="first") & ~time_index.isna()})
 
     # Ensure strictly increasing time
-    da = da.sortby(time_key)
+    if not is_monotonic:
+        da = da.sortby(time_key)
 
     # Now resample
     return da.resample({time_key: "1MS"}).mean()
 
 
+def _decimate_minmax(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line to the minimum and maximum of each bin of consecutive samples.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        One-dimensional coordinates and values of the line.
+    max_points : int
+        Approximate number of points to keep.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The decimated ``x`` and ``y``, in their original order. Inputs with at
+        most ``max_points`` samples are returned unchanged.
+
+    """
+    n = y.size
+    n_bins = max_points // 2
+    if n_bins < 1 or n <= max_points:
+        return x, y
+
+    stride = -(-n // n_bins)
+    n_full = n // stride * stride
+    bins = y[:n_full].reshape(-1, stride)
+    # NaN never wins either reduction; an all-NaN bin keeps its NaN as a gap
+    is_nan = np.isnan(bins)
+    i_min = np.where(is_nan, np.inf, bins).argmin(axis=1)
+    i_max = np.where(is_nan, -np.inf, bins).argmax(axis=1)
+
+    offsets = np.arange(0, n_full, stride)[:, None]
+    idx = (np.sort(np.stack([i_min, i_max], axis=1), axis=1) + offsets).ravel()
+    idx = np.concatenate([idx, np.arange(n_full, n)])
+    return x[idx], y[idx]
+
+
 def plot_amoc_timeseries(
     data,
     varnames=None,
@@ -337,6 +524,8 @@ def plot_amoc_timeseries(
         colors = ["red", "darkblue", "green", "purple", "orange"]
 
     fig, ax = plt.subplots(figsize=figsize)
+    # Two points (min and max) per horizontal pixel keep the raw envelope intact
+    max_points = int(figsize[0] * fig.dpi) * 2
 
     for i, item in enumerate(data):
         label = labels[i]
@@ -349,29 +538,32 @@ def plot_amoc_timeseries(
         else:
             da = item
 
-        # Get time coordinate (case sensitive)
-        for coord in da.coords:
-            if coord.lower() == "time":
-                time_key = coord
-                break
-        else:
-            raise ValueError("No time coordinate found in dataset.")
+        time_key = _time_key(da)
 
-        # Plot original
+        # Plot original, reduced to the per-pixel extremes for long series
         if plot_raw:
+            x_raw, y_raw = da[time_key].values, da.values
+            if da.ndim == 1:
+                x_raw, y_raw = _decimate_minmax(x_raw, y_raw, max_points)
             ax.plot(
-                da[time_key],
-                da,
+                x_raw,
+                y_raw,
                 color="grey",
                 alpha=0.5,
                 linewidth=0.5,
                 label=f"{label} (raw)" if label else "Original",
+                rasterized=True,
             )
 
         # Plot monthly average if requested
         if resample_monthly:
 
-            da_monthly = monthly_resample(da)
+            # Indexing a Dataset builds a new DataArray on every call, which
+            # could never hit the resample cache, so only cache passed arrays
+            if da is item:
+                da_monthly = monthly_resample(da)
+            else:
+                da_monthly = _monthly_resample(da, time_key)
 
             ax.plot(
                 da_monthly[time_key],
@@ -407,6 +599,11 @@ def plot_amoc_timeseries(
     return fig, ax
 
 
+# Shared time axis of the monthly anomaly panels
+_ANOM_XMIN = pd.Timestamp("2000-01-01")
+_ANOM_XMAX = pd.Timestamp("2023-12-31")
+
+
 def plot_monthly_anomalies(**kwargs) -> tuple[plt.Figure, list[plt.Axes]]:
     """Plot the monthly anomalies for various datasets.
     Pass keyword arguments in the form: `label_name_data`, `label_name_label`.
@@ -433,7 +630,7 @@ def plot_monthly_anomalies(**kwargs) -> tuple[plt.Figure, list[plt.Axes]]:
     fig, axes = plt.subplots(len(datasets), 1, figsize=(10, 16), sharex=True)
 
     for i, (data, label, color) in enumerate(zip(datasets, labels, color_cycle)):
-        time = data["TIME"]
+        time = data[_time_key(data)]
         axes[i].plot(time, data, color=color, label=label)
         axes[i].axhline(0, color="black", linestyle="--", linewidth=0.5)
         axes[i].set_title(label)
@@ -449,7 +646,7 @@ def plot_monthly_anomalies(**kwargs) -> tuple[plt.Figure, list[plt.Axes]]:
         # Style choices
         axes[i].spines["top"].set_visible(False)
         axes[i].spines["right"].set_visible(False)
-        axes[i].set_xlim([pd.Timestamp("2000-01-01"), pd.Timestamp("2023-12-31")])
+        axes[i].set_xlim([_ANOM_XMIN, _ANOM_XMAX])
         axes[i].set_clip_on(False)
 
     axes[-1].set_xlabel("Time")
@@ -461,25 +658,69 @@ def plot_monthly_anomalies(**kwargs) -> tuple[plt.Figure, list[plt.Axes]]:
 # PyGMT Publication Plotting Functions
 # ------------------------------------------------------------------------------------
 
-# Check for PyGMT availability
-try:
-    import pygmt
 
-    HAS_PYGMT = True
-except Exception:
-    # Catch ImportError and any GMT library loading errors (GMTCLibNotFoundError, etc.)
-    HAS_PYGMT = False
+# Importing PyGMT probes the GMT shared library, so it is deferred until a PyGMT
+# function (or HAS_PYGMT) is first used and the outcome is cached.
+@lru_cache(maxsize=None)
+def _get_pygmt():
+    """Import PyGMT on first use, returning None if it cannot be loaded."""
+    try:
+        import pygmt
+    except Exception:
+        # Catch ImportError and any GMT library loading errors (GMTCLibNotFoundError, etc.)
+        return None
+    return pygmt
+
+
+def __getattr__(name):
+    if name == "HAS_PYGMT":
+        return _get_pygmt() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _check_pygmt():
-    """Check if PyGMT is available and raise informative error if not."""
-    if not HAS_PYGMT:
+    """Return the PyGMT module, raising an informative error if it is not available."""
+    pygmt = _get_pygmt()
+    if pygmt is None:
         raise ImportError(
             "PyGMT is required for publication-quality plots. "
             "Install with: pip install pygmt\n"
             "Note: PyGMT requires GMT to be installed separately. "
             "See https://www.pygmt.org/latest/install.html for details."
         )
+    return pygmt
+
+
+# Shared GMT defaults for the AMOCatlas publication figures
+_AMOCATLAS_GMT_CONFIG = MappingProxyType(
+    {
+        "FONT_ANNOT_PRIMARY": "20p",  # tick labels
+        "FONT_LABEL": "20p",  # axis labels
+        "FONT_TITLE": "20p",  # title (if used)
+        "MAP_TICK_LENGTH_PRIMARY": "6p",  # major ticks longer
+        "MAP_TICK_PEN_PRIMARY": "1.2p",  # major ticks thicker
+        "MAP_LABEL_OFFSET": "10p",  # spacing axis ↔ label
+        "MAP_TICK_LENGTH_SECONDARY": "3p",  # minor ticks longer
+        "MAP_TICK_PEN_SECONDARY": "0.8p",  # minor ticks thicker
+        "MAP_GRID_PEN": "0.25p,gray70,10_5",  # fine dashed grid
+    }
+)
+
+
+def _apply_amocatlas_style(**overrides):
+    """Apply the AMOCatlas GMT defaults in a single ``pygmt.config`` call.
+
+    Called after each ``pygmt.Figure()`` is created, and never skipped: GMT
+    modern-mode defaults may be scoped to the active figure, and the user may
+    have changed them with ``pygmt.config`` since the last AMOCatlas plot.
+
+    Parameters
+    ----------
+    **overrides
+        GMT parameters that replace the matching AMOCatlas defaults.
+
+    """
+    _get_pygmt().config(**{**_AMOCATLAS_GMT_CONFIG, **overrides})
 
 
 def _add_amocatlas_timestamp(fig):
@@ -521,30 +762,23 @@ def plot_moc_timeseries_pygmt(
         If PyGMT is not installed.
 
     """
-    _check_pygmt()
+    pygmt = _check_pygmt()
 
     fig = pygmt.Figure()
 
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="20p",  # tick labels
-        FONT_LABEL="20p",  # axis labels
-        FONT_TITLE="20p",  # title (if used)
-        MAP_TICK_LENGTH_PRIMARY="6p",  # major ticks longer
-        MAP_TICK_PEN_PRIMARY="1.2p",  # major ticks thicker
-        MAP_LABEL_OFFSET="10p",  # spacing axis ↔ label
-        MAP_TICK_LENGTH_SECONDARY="3p",  # minor ticks longer
-        MAP_TICK_PEN_SECONDARY="0.8p",  # minor ticks thicker
-        MAP_GRID_PEN="0.25p,gray70,10_5",  # fine dashed grid
-    )
+    _apply_amocatlas_style()
 
     # --- Define plotting region ---
     col_filtered = f"{column}_filtered"
-    xmax = max(df["time_num"].max(), 2025)
     if col_filtered not in df.columns:
         df[col_filtered] = df[column]
-    ymin = df[[column, col_filtered]].min().min()
-    ymax = df[[column, col_filtered]].max().max()
-    region = [df["time_num"].min(), xmax, ymin, ymax]
+    t = df["time_num"].to_numpy()
+    y = df[column].to_numpy()
+    y_filtered = df[col_filtered].to_numpy()
+    xmax = max(np.nanmax(t), 2025)
+    ymin = float(min(np.nanmin(y), np.nanmin(y_filtered)))
+    ymax = float(max(np.nanmax(y), np.nanmax(y_filtered)))
+    region = [np.nanmin(t), xmax, ymin, ymax]
 
     # --- Basemap ---
     fig.basemap(
@@ -552,13 +786,11 @@ def plot_moc_timeseries_pygmt(
     )
 
     # --- Plot original series ---
-    fig.plot(x=df["time_num"], y=df[column], pen=".75p,red", label="Original")
+    fig.plot(x=t, y=y, pen=".75p,red", label="Original")
 
     # --- Plot filtered: thick white background + black foreground ---
-    fig.plot(x=df["time_num"], y=df[col_filtered], pen="3.5p,white")
-    fig.plot(
-        x=df["time_num"], y=df[col_filtered], pen="2.5p,black", label="Filtered (Tukey)"
-    )
+    fig.plot(x=t, y=y_filtered, pen="3.5p,white")
+    fig.plot(x=t, y=y_filtered, pen="2.5p,black", label="Filtered (Tukey)")
 
     # Add AMOCatlas timestamp
     _add_amocatlas_timestamp(fig)
@@ -588,64 +820,46 @@ def plot_osnap_components_pygmt(df: pd.DataFrame):
         If PyGMT is not installed.
 
     """
-    _check_pygmt()
+    pygmt = _check_pygmt()
 
     fig = pygmt.Figure()
 
     # Styling
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="20p",
-        FONT_LABEL="20p",
-        FONT_TITLE="20p",
-        MAP_TICK_LENGTH_PRIMARY="6p",
-        MAP_TICK_PEN_PRIMARY="1.2p",
-        MAP_LABEL_OFFSET="10p",
-        MAP_TICK_LENGTH_SECONDARY="3p",
-        MAP_TICK_PEN_SECONDARY="0.8p",
-        MAP_GRID_PEN="0.25p,gray70,10_5",
-    )
+    _apply_amocatlas_style()
 
     # Region
-    xmax = max(df["time_num"].max(), 2022)
-    ymin = df[["MOC_ALL", "MOC_EAST", "MOC_WEST"]].min().min() - 1
-    ymax = df[["MOC_ALL", "MOC_EAST", "MOC_WEST"]].max().max() + 1
-    ymin = min(ymin, -5)
-    ymax = max(ymax, 30)
-    region = [df["time_num"].min(), xmax, ymin, ymax]
+    t = df["time_num"].to_numpy()
+    moc_arr = df[["MOC_ALL", "MOC_EAST", "MOC_WEST"]].to_numpy()
+    xmax = max(np.nanmax(t), 2022)
+    ymin = min(float(np.nanmin(moc_arr)) - 1, -5)
+    ymax = max(float(np.nanmax(moc_arr)) + 1, 30)
+    region = [np.nanmin(t), xmax, ymin, ymax]
 
     # Basemap
     fig.basemap(
         region=region, projection="X15c/7c", frame=["xaf", "yafg5f2+lMOC [Sv]", "WS"]
     )
 
-    # --- Shaded error for EAST ---
-    east_upper = df["MOC_EAST"] + df["MOC_EAST_ERR"]
-    east_lower = df["MOC_EAST"] - df["MOC_EAST_ERR"]
-
-    # Build filled polygon for EAST
-    import numpy as np
-
-    x_east = np.concatenate([df["time_num"], df["time_num"][::-1]])
-    y_east = np.concatenate([east_upper, east_lower[::-1]])
-    fig.plot(x=x_east, y=y_east, fill="orange", transparency=70, close=True)
-
-    # --- Shaded error for WEST ---
-    west_upper = df["MOC_WEST"] + df["MOC_WEST_ERR"]
-    west_lower = df["MOC_WEST"] - df["MOC_WEST_ERR"]
-    x_west = np.concatenate([df["time_num"], df["time_num"][::-1]])
-    y_west = np.concatenate([west_upper, west_lower[::-1]])
-    fig.plot(x=x_west, y=y_west, fill="blue", transparency=70, close=True)
+    # --- Shaded error bands ---
+    # Both bands share one x outline (time forward, then back); each y outline
+    # is written straight into its half of a preallocated buffer.
+    n = len(df)
+    x_poly = np.empty(2 * n)
+    x_poly[:n] = t
+    x_poly[n:] = t[::-1]
+
+    for name, fill in (("EAST", "orange"), ("WEST", "blue")):
+        moc = df[f"MOC_{name}"].to_numpy()
+        err = df[f"MOC_{name}_ERR"].to_numpy()
+        y_poly = np.empty(2 * n)
+        np.add(moc, err, out=y_poly[:n])
+        np.subtract(moc[::-1], err[::-1], out=y_poly[n:])
+        fig.plot(x=x_poly, y=y_poly, fill=fill, transparency=70, close=True)
 
     # --- Main curves ---
-    fig.plot(x=df["time_num"], y=df["MOC_ALL"], pen="2.5p,black", label="Total")
-    fig.plot(
-        x=df["time_num"],
-        y=df["MOC_EAST"],
-        pen="2.5p,orange",
-        label="East",
-        transparency=20,
-    )
-    fig.plot(x=df["time_num"], y=df["MOC_WEST"], pen="2.5p,blue", label="West")
+    fig.plot(x=t, y=moc_arr[:, 0], pen="2.5p,black", label="Total")
+    fig.plot(x=t, y=moc_arr[:, 1], pen="2.5p,orange", label="East", transparency=20)
+    fig.plot(x=t, y=moc_arr[:, 2], pen="2.5p,blue", label="West")
 
     # Legend
     fig.legend(position="JMR+jMR+o-1.5i/0i", box=True)
@@ -680,28 +894,21 @@ def plot_rapid_components_pygmt(df: pd.DataFrame):
         If PyGMT is not installed.
 
     """
-    _check_pygmt()
+    pygmt = _check_pygmt()
 
     fig = pygmt.Figure()
 
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="20p",
-        FONT_LABEL="20p",
-        FONT_TITLE="20p",
-        MAP_TICK_LENGTH_PRIMARY="6p",
-        MAP_TICK_PEN_PRIMARY="1.2p",
-        MAP_LABEL_OFFSET="10p",
-        MAP_TICK_LENGTH_SECONDARY="3p",
-        MAP_TICK_PEN_SECONDARY="0.8p",
-        MAP_GRID_PEN="0.25p,gray70,10_5",
-    )
+    _apply_amocatlas_style()
 
     # Set region based on full value range
-    xmax = max(df["time_num"].max(), 2025)
+    t = df["time_num"].to_numpy()
     components = ["moc_mar_hc10", "t_gs10", "t_ek10", "t_umo10"]
-    ymin = df[components].min().min() - 1
-    ymax = df[components].max().max() + 1
-    region = [df["time_num"].min(), xmax, ymin, ymax]
+    comp_arr = df[components].to_numpy()
+    xmax_data = np.nanmax(t)
+    xmax = max(xmax_data, 2025)
+    ymin = float(np.nanmin(comp_arr)) - 1
+    ymax = float(np.nanmax(comp_arr)) + 1
+    region = [np.nanmin(t), xmax, ymin, ymax]
 
     # Basemap
     fig.basemap(
@@ -711,23 +918,22 @@ def plot_rapid_components_pygmt(df: pd.DataFrame):
     )
 
     # Plot each component with custom colors
-    fig.plot(x=df["time_num"], y=df["moc_mar_hc10"], pen="1.5p,red", label="MOC")
-    fig.plot(x=df["time_num"], y=df["t_gs10"], pen="1.5p,blue", label="Florida Current")
-    fig.plot(x=df["time_num"], y=df["t_ek10"], pen="1.5p,black", label="Ekman")
-    fig.plot(
-        x=df["time_num"], y=df["t_umo10"], pen="1.5p,magenta", label="Upper Mid-Ocean"
-    )
+    fig.plot(x=t, y=comp_arr[:, 0], pen="1.5p,red", label="MOC")
+    fig.plot(x=t, y=comp_arr[:, 1], pen="1.5p,blue", label="Florida Current")
+    fig.plot(x=t, y=comp_arr[:, 2], pen="1.5p,black", label="Ekman")
+    fig.plot(x=t, y=comp_arr[:, 3], pen="1.5p,magenta", label="Upper Mid-Ocean")
 
     # Plot labels at end of time series with slight offset
 
     # Use the actual end date of the time series
-    x_label = df["time_num"].max()
+    x_label = xmax_data
 
+    comp_means = np.nanmean(comp_arr, axis=0)
     y_labels = {
-        "MOC": df["moc_mar_hc10"].mean(),
-        "Florida Current": df["t_gs10"].mean(),
-        "Ekman": df["t_ek10"].mean(),
-        "Upper Mid-Ocean": df["t_umo10"].mean(),
+        "MOC": comp_means[0],
+        "Florida Current": comp_means[1],
+        "Ekman": comp_means[2],
+        "Upper Mid-Ocean": comp_means[3],
     }
     colors = {
         "MOC": "red",
@@ -779,7 +985,7 @@ def plot_all_moc_pygmt(osnap_df, rapid_df, move_df, samba_df, filtered: bool = F
         If PyGMT is not installed.
 
     """
-    _check_pygmt()
+    pygmt = _check_pygmt()
 
     magenta1 = "231/41/138"
     red1 = "227/26/28"
@@ -797,25 +1003,15 @@ def plot_all_moc_pygmt(osnap_df, rapid_df, move_df, samba_df, filtered: bool = F
         (samba_df, "Anomaly [Sv]", (-10, 15), 6, "SAMBA 34.5°S", blue1, "ES"),
     ]
 
-    # Find global x range
-    xmin = min(min(df["time_num"].min() for df, _, _, _, _, _, _ in dfs), 2000)
-    xmax = max(max(df["time_num"].max() for df, _, _, _, _, _, _ in dfs), 2025)
+    # Find global x range, ignoring missing times and without assuming order
+    xmin = min(min(np.nanmin(df["time_num"].to_numpy()) for df, *_ in dfs), 2000)
+    xmax = max(max(np.nanmax(df["time_num"].to_numpy()) for df, *_ in dfs), 2025)
 
     # Create figure
     fig = pygmt.Figure()
 
     panel_width = 20  # cm
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="20p",
-        FONT_LABEL="20p",
-        FONT_TITLE="20p",
-        MAP_TICK_LENGTH_PRIMARY="6p",
-        MAP_TICK_PEN_PRIMARY="1.2p",
-        MAP_LABEL_OFFSET="10p",
-        MAP_TICK_LENGTH_SECONDARY="3p",
-        MAP_TICK_PEN_SECONDARY="0.8p",
-        MAP_GRID_PEN="0.25p,gray70,10_5",
-    )
+    _apply_amocatlas_style()
 
     # Set locations for labels
     myxloc = [2000.2, 2000.2, 2000.2, 2000.2]
@@ -842,13 +1038,13 @@ def plot_all_moc_pygmt(osnap_df, rapid_df, move_df, samba_df, filtered: bool = F
         # Plot reference line and data
         fig.plot(x=[xmin, xmax], y=[myyloc[i], myyloc[i]], pen="1.5p,gray50,2_2")
 
+        t = df["time_num"].to_numpy()
+        y = df[col].to_numpy()
         if filtered:
-            fig.plot(x=df["time_num"], y=df[col], pen="3.5p,white", no_clip=(i == 3))
-            fig.plot(x=df["time_num"], y=df[col], pen="2p," + pen_col, no_clip=(i == 3))
+            fig.plot(x=t, y=y, pen="3.5p,white", no_clip=(i == 3))
+            fig.plot(x=t, y=y, pen="2p," + pen_col, no_clip=(i == 3))
         else:
-            fig.plot(
-                x=df["time_num"], y=df[col], pen="1.5p," + pen_col, no_clip=(i == 3)
-            )
+            fig.plot(x=t, y=y, pen="1.5p," + pen_col, no_clip=(i == 3))
 
         # Add text annotation
         fig.text(
@@ -896,10 +1092,7 @@ def plot_bryden2005_pygmt():
     Nature, 438(7068), 655-657.
 
     """
-    _check_pygmt()
-
-    import os
-    import pandas as pd
+    pygmt = _check_pygmt()
 
     # Bryden 2005 data
     years = [1957, 1981, 1992, 1998, 2004]
@@ -907,10 +1100,11 @@ def plot_bryden2005_pygmt():
     xticks = [1957, 1970, 1981, 1992, 2004]
     xtick_labels = ["af", "af", "af", "af", "af"]
 
-    # Write custom tick annotation file
-    with open("custom_xticks.txt", "w") as f:
-        for x, label in zip(xticks, xtick_labels):
-            f.write(f"{x} {label}\n")
+    # Write custom tick annotation file to a private temporary path so that
+    # concurrent calls do not share it and the working directory stays clean
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.writelines(f"{x} {label}\n" for x, label in zip(xticks, xtick_labels))
+        tick_path = f.name
 
     # Create DataFrame
     data = pd.DataFrame({"Year": years, "AMOC": amoc_values})
@@ -918,24 +1112,17 @@ def plot_bryden2005_pygmt():
     # Create figure
     fig = pygmt.Figure()
 
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="18p",  # tick labels
-        FONT_LABEL="18p",  # axis labels
-        FONT_TITLE="18p",  # title (if used)
-        MAP_TICK_LENGTH_PRIMARY="6p",  # major ticks longer
-        MAP_TICK_PEN_PRIMARY="1.2p",  # major ticks thicker
-        MAP_LABEL_OFFSET="10p",  # spacing axis ↔ label
-        MAP_TICK_LENGTH_SECONDARY="3p",  # minor ticks longer
-        MAP_TICK_PEN_SECONDARY="0.8p",  # minor ticks thicker
-        MAP_GRID_PEN="0.25p,gray70,10_5",  # fine dashed grid
-    )
+    _apply_amocatlas_style(FONT_ANNOT_PRIMARY="18p", FONT_LABEL="18p", FONT_TITLE="18p")
 
-    # Set region and frame
-    fig.basemap(
-        region=[1955, 2006, 13, 24],
-        projection="X8c/6c",
-        frame=["WS", "yaf+lMOC [Sv]", "xccustom_xticks.txt"],
-    )
+    # Set region and frame; GMT reads the tick file while drawing the basemap
+    try:
+        fig.basemap(
+            region=[1955, 2006, 13, 24],
+            projection="X8c/6c",
+            frame=["WS", "yaf+lMOC [Sv]", f"xc{tick_path}"],
+        )
+    finally:
+        os.unlink(tick_path)
 
     # Plot red line
     fig.plot(x=data["Year"], y=data["AMOC"], pen="2p,red")
@@ -943,16 +1130,27 @@ def plot_bryden2005_pygmt():
     # Plot red diamonds (with black edge)
     fig.plot(x=data["Year"], y=data["AMOC"], style="d0.3c", fill="red", pen="red")
 
-    # Delete the custom tick file
-    if os.path.exists("custom_xticks.txt"):
-        os.remove("custom_xticks.txt")
-
     # Add AMOCatlas timestamp
     _add_amocatlas_timestamp(fig)
 
     return fig
 
 
+# Panel layout for plot_all_moc_overlaid_pygmt, one entry per array in the
+# order OSNAP, RAPID, MOVE, SAMBA. The fields are kept as parallel tuples so
+# each loop reads only the ones it needs.
+_OVERLAY_PANEL_HEIGHT = 6  # cm, shared by all panels
+_OVERLAY_YLABELS = ("MOC [Sv]", "MOC [Sv]", "MOC [Sv]", "Anomaly [Sv]")
+_OVERLAY_YLIMS = ((10, 20), (10, 20), (10, 20), (-5, 5))
+_OVERLAY_NAMES = ("OSNAP", "RAPID 26°N", "MOVE 16°N", "SAMBA 34.5°S")
+# green, red, magenta and blue of the original colour scheme
+_OVERLAY_COLORS = ("35/139/69", "227/26/28", "231/41/138", "8/104/172")
+_OVERLAY_FRAMES = ("W", "W", "W", "ES")
+# Lower-left corner of each array's name label
+_OVERLAY_TEXT_X = (2018.2, 2006.2, 2000.2, 2015.2)
+_OVERLAY_TEXT_Y = (14.0, 19.5, 12.5, -3.5)
+
+
 def plot_all_moc_overlaid_pygmt(
     osnap_df: pd.DataFrame,
     rapid_df: pd.DataFrame,
@@ -989,88 +1187,62 @@ def plot_all_moc_overlaid_pygmt(
         If PyGMT is not installed.
 
     """
-    _check_pygmt()
-
-    # Color scheme matching original
-    magenta1 = "231/41/138"
-    red1 = "227/26/28"
-    blue1 = "8/104/172"
-    green1 = "35/139/69"
+    pygmt = _check_pygmt()
 
     # Select column based on filtered flag
     col = "moc_filtered" if filtered else "moc"
 
-    # Prepare data and labels - overlay mode (shiftflag=False)
-    dfs = [
-        (osnap_df, "MOC [Sv]", (10, 20), 6, "OSNAP", green1, "W"),
-        (rapid_df, "MOC [Sv]", (10, 20), 6, "RAPID 26°N", red1, "W"),
-        (move_df, "MOC [Sv]", (10, 20), 6, "MOVE 16°N", magenta1, "W"),
-        (samba_df, "Anomaly [Sv]", (-5, 5), 6, "SAMBA 34.5°S", blue1, "ES"),
+    # Pull each (time, value) column pair out as NumPy arrays once, shared by
+    # the x range below and the panel plots. The x range ignores missing times
+    # and does not assume the series are sorted.
+    arrs = [
+        (df["time_num"].to_numpy(), df[col].to_numpy())
+        for df in (osnap_df, rapid_df, move_df, samba_df)
     ]
-
-    # Find global x range
-    xmin = min(min(df["time_num"].min() for df, _, _, _, _, _, _ in dfs), 2000)
-    xmax = max(max(df["time_num"].max() for df, _, _, _, _, _, _ in dfs), 2025)
+    xmin = min(min(np.nanmin(t) for t, _ in arrs), 2000)
+    xmax = max(max(np.nanmax(t) for t, _ in arrs), 2025)
 
     # Create figure
     fig = pygmt.Figure()
 
     panel_width = 20  # cm
-    pygmt.config(
-        FONT_ANNOT_PRIMARY="20p",
-        FONT_LABEL="20p",
-        FONT_TITLE="20p",
-        MAP_TICK_LENGTH_PRIMARY="6p",
-        MAP_TICK_PEN_PRIMARY="1.2p",
-        MAP_LABEL_OFFSET="10p",
-        MAP_TICK_LENGTH_SECONDARY="3p",
-        MAP_TICK_PEN_SECONDARY="0.8p",
-        MAP_GRID_PEN="0.25p,gray70,10_5",
-    )
-
-    # Label positions for overlay mode
-    myxloc = [2018.2, 2006.2, 2000.2, 2015.2]
-    myyloc = [13.5, 19, 15, 0]
-    myyoff = [0, 0, -3, -4]
+    _apply_amocatlas_style()
 
-    for i, (
-        df,
-        label,
-        (ymin, ymax),
-        panel_height,
-        txt_lbl,
-        pen_col,
-        frame_coord,
-    ) in enumerate(dfs):
+    for i, (t, y) in enumerate(arrs):
+        ymin, ymax = _OVERLAY_YLIMS[i]
+        pen_col = _OVERLAY_COLORS[i]
         region = [xmin, xmax, ymin, ymax]
 
+        # All panels share one x axis, so only the last one annotates it
         fig.basemap(
             region=region,
-            projection=f"X{panel_width}c/{panel_height}c",
-            frame=["xaf", f"yaff2+l{label}", frame_coord],
+            projection=f"X{panel_width}c/{_OVERLAY_PANEL_HEIGHT}c",
+            frame=[
+                "xaf" if i == len(arrs) - 1 else "xf",
+                f"yaff2+l{_OVERLAY_YLABELS[i]}",
+                _OVERLAY_FRAMES[i],
+            ],
         )
 
         # Add gray horizontal line at y=0
         fig.plot(x=[xmin, xmax], y=[0, 0], pen="1.5p,gray50,2_2")
 
-        # Plot the time series with white background + colored foreground
-        fig.plot(x=df["time_num"], y=df[col], pen="3.5p,white", no_clip=True)
-        fig.plot(x=df["time_num"], y=df[col], pen="2p," + pen_col, no_clip=True)
+        # Plot the time series with white background + colored foreground,
+        # both drawn from one contiguous (x, y) table built once per panel
+        line = np.column_stack((t, y))
+        fig.plot(data=line, pen="3.5p,white", no_clip=True)
+        fig.plot(data=line, pen="2p," + pen_col, no_clip=True)
 
         # Add text annotation
         fig.text(
-            text=txt_lbl,
-            x=myxloc[i],
-            y=myyloc[i] + myyoff[i] + 0.5,
+            text=_OVERLAY_NAMES[i],
+            x=_OVERLAY_TEXT_X[i],
+            y=_OVERLAY_TEXT_Y[i],
             font=f"18p,Helvetica,{pen_col}",
             justify="LB",
             no_clip=True,
         )
 
-        # No shifting between panels in overlay mode
-        if i < len(dfs) - 1:
-            fig.shift_origin(yshift=0)
-
     # Add AMOCatlas timestamp
     _add_amocatlas_timestamp(fig)
 
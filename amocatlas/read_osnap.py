@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Union
 
 import xarray as xr
@@ -88,6 +90,16 @@ OSNAP_FILE_METADATA = {
     },
 }
 
+# Global metadata merged with each file's own entries, built once at import so
+# read_osnap usually only looks the result up. Files added to OSNAP_FILE_URLS
+# later are merged when they are read.
+_MERGED_METADATA = MappingProxyType(
+    {
+        file: MappingProxyType({**OSNAP_METADATA, **OSNAP_FILE_METADATA.get(file, {})})
+        for file in OSNAP_FILE_URLS
+    }
+)
+
 
 def read_osnap(
     source: str = None,
@@ -96,6 +108,7 @@ def read_osnap(
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
     version: str = "2025",
+    check_remote: bool = False,
 ) -> list[xr.Dataset]:
     """Load the OSNAP transport datasets from a URL or local file path into xarray Datasets.
 
@@ -116,6 +129,9 @@ def read_osnap(
     version : str, optional
         Dataset version to use ("2025" for 2014-2022 data, "2020" for 2014-2020 data).
         Defaults to "2025" (latest version).
+    check_remote : bool, optional
+        If True, a cached file is only reused when the server reports it is
+        unchanged since it was downloaded; otherwise it is fetched again.
 
     Returns
     -------
@@ -154,44 +170,60 @@ def read_osnap(
     local_data_dir = Path(data_dir) if data_dir else utilities.get_default_data_dir()
     local_data_dir.mkdir(parents=True, exist_ok=True)
 
-    datasets = []
-
+    # Check every file up front so a bad entry fails before any download starts
+    netcdf_files = []
     for file in file_list:
         if not file.lower().endswith(".nc"):
             log.warning("Skipping non-NetCDF file: %s", file)
             continue
 
-        download_url = OSNAP_FILE_URLS.get(file)
-        if not download_url:
+        if not OSNAP_FILE_URLS.get(file):
             log.error("No download URL defined for OSNAP file: %s", file)
             raise FileNotFoundError(f"No download URL defined for OSNAP file {file}")
+        netcdf_files.append(file)
 
+    def _resolve(file: str) -> tuple[str, Path]:
         file_path = utilities.resolve_file_path(
             file_name=file,
             source=source,
-            download_url=download_url,
+            download_url=OSNAP_FILE_URLS[file],
             local_data_dir=local_data_dir,
             redownload=redownload,
+            check_remote=check_remote,
         )
+        return file, file_path
+
+    # Resolve (and if needed download) the files concurrently, so the request
+    # latency of each download overlaps with the others. map() keeps the input
+    # order and re-raises the first failure. Opening stays serial below, as the
+    # netCDF4/HDF5 libraries are not safe to call from several threads.
+    resolved_files = []
+    if netcdf_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(netcdf_files))) as executor:
+            resolved_files = list(executor.map(_resolve, netcdf_files))
 
-        # Open dataset
+    datasets = []
+
+    for file, file_path in resolved_files:
+        # Open dataset; variable data stays on disk until it is accessed. The
+        # engine is named explicitly so xarray skips probing every backend.
         try:
             log.info("Opening OSNAP dataset: %s", file_path)
-            ds = xr.open_dataset(file_path)
+            ds = xr.open_dataset(file_path, engine="netcdf4")
         except Exception as e:
             log.error("Failed to open NetCDF file: %s: %s", file_path, e)
             raise FileNotFoundError(f"Failed to open NetCDF file: {file_path}: {e}")
 
         # Attach metadata
-        file_metadata = OSNAP_FILE_METADATA.get(file, {})
-        log.info("Attaching metadata to dataset from file: %s", file)
         utilities.safe_update_attrs(
             ds,
             {
                 "source_file": file,
                 "source_path": str(file_path),
-                **OSNAP_METADATA,
-                **file_metadata,
+                **(
+                    _MERGED_METADATA.get(file)
+                    or {**OSNAP_METADATA, **OSNAP_FILE_METADATA.get(file, {})}
+                ),
             },
         )
 
@@ -201,7 +233,11 @@ def read_osnap(
         log.error("No valid NetCDF files found in %s", file_list)
         raise FileNotFoundError(f"No valid NetCDF files found in {file_list}")
 
-    log.info("Successfully loaded %d OSNAP dataset(s)", len(datasets))
+    log.info(
+        "Successfully loaded %d OSNAP dataset(s): %s",
+        len(datasets),
+        [file for file, _ in resolved_files],
+    )
 
     return datasets
 
@@ -212,6 +248,7 @@ def read_osnap_2025(
     transport_only: bool = True,
     data_dir: Union[str, Path, None] = None,
     redownload: bool = False,
+    check_remote: bool = False,
 ) -> list[xr.Dataset]:
     """Load the OSNAP 2025 datasets (2014-2022 coverage) from a URL or local file path.
 
@@ -230,6 +267,8 @@ def read_osnap_2025(
         Optional local data directory.
     redownload : bool, optional
         If True, force redownload of the data.
+    check_remote : bool, optional
+        If True, only reuse a cached file the server reports as unchanged.
 
     Returns
     -------
@@ -244,4 +283,5 @@ def read_osnap_2025(
         data_dir=data_dir,
         redownload=redownload,
         version="2025",
+        check_remote=check_remote,
     )
@@ -291,20 +291,20 @@ def to_decimal_year(dates) -> pd.Series:
     if isinstance(dates, pd.DatetimeIndex):
         dates = pd.Series(dates)
 
-    # Drop NaN values and handle them separately
-    valid_dates = dates.dropna()
-    if len(valid_dates) == 0:
-        return pd.Series([np.nan] * len(dates), index=dates.index)
-
-    year = valid_dates.dt.year
-    start = pd.to_datetime(year.astype(str) + "-01-01")
-    end = pd.to_datetime((year + 1).astype(str) + "-01-01")
-    decimal_years = year + (valid_dates - start) / (end - start)
-
-    # Create full series with NaN for invalid dates
-    result = pd.Series([np.nan] * len(dates), index=dates.index)
-    result.loc[valid_dates.index] = decimal_years
-    return result
+    # Work on the datetime64 values directly: truncating to year precision
+    # gives each date's year start, so the fraction needs no pandas .dt
+    # accessors or string parsing. Invalid dates (NaT) are left as NaN.
+    values = pd.to_datetime(dates).to_numpy()
+    valid = ~np.isnat(values)
+    values = values[valid]
+    years = values.astype("datetime64[Y]")
+    start = years.astype(values.dtype)
+    end = (years + np.timedelta64(1, "Y")).astype(values.dtype)
+    decimal_years = np.full(len(valid), np.nan)
+    decimal_years[valid] = (
+        years.astype(np.int64) + 1970 + (values - start) / (end - start)
+    )
+    return pd.Series(decimal_years, index=dates.index)
 
 
 def extract_time_and_time_num(ds: xr.Dataset, time_var: str = "TIME") -> pd.DataFrame:
@@ -1,7 +1,9 @@
+import json
+import shutil
 from ftplib import FTP
 from functools import wraps
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 import yaml
 import re
@@ -87,6 +89,7 @@ def resolve_file_path(
     download_url: Optional[str],
     local_data_dir: Path,
     redownload: bool = False,
+    check_remote: bool = False,
 ) -> Path:
     """Resolve the path to a data file, using local source, cache, or downloading if necessary.
 
@@ -102,6 +105,10 @@ def resolve_file_path(
         Directory where downloaded files are stored.
     redownload : bool, optional
         If True, force redownload even if cached file exists.
+    check_remote : bool, optional
+        If True, a cached file is only reused when a HEAD request shows the
+        remote file is unchanged since it was downloaded; see
+        :func:`download_file`. Ignored when ``redownload`` is True.
 
     Returns
     -------
@@ -120,9 +127,10 @@ def resolve_file_path(
             log.error("Local file not found: %s", candidate_file)
             raise FileNotFoundError(f"Local file not found: {candidate_file}")
 
-    # Use cached file if available and redownload is False
+    # Use cached file if available and redownload is False, unless it has to
+    # be checked against the remote first
     cached_file = local_data_dir / file_name
-    if cached_file.exists() and not redownload:
+    if cached_file.exists() and not redownload and not (check_remote and download_url):
         log.info("Using cached file: %s", cached_file)
         return cached_file
 
@@ -131,7 +139,11 @@ def resolve_file_path(
         try:
             log.info("Downloading file from %s to %s", download_url, local_data_dir)
             return download_file(
-                download_url, local_data_dir, redownload=redownload, filename=file_name
+                download_url,
+                local_data_dir,
+                redownload=redownload,
+                filename=file_name,
+                check_remote=check_remote,
             )
         except Exception as e:
             log.error("Failed to download %s: %s", download_url, e)
@@ -343,11 +355,82 @@ def _is_valid_file(path: str) -> bool:
     return Path(path).is_file() and path.endswith(".nc")
 
 
+# Sidecar written next to each HTTP download, recording what the server
+# reported for it so an unchanged file can be recognised with a HEAD request
+_META_SUFFIX = ".meta.json"
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Seconds to wait for the server to connect or send data
+_REQUEST_TIMEOUT = 60
+
+
+def _remote_file_info(headers: Mapping[str, str]) -> Dict[str, Optional[str]]:
+    """Extract the headers that identify a version of a remote file."""
+    return {
+        "etag": headers.get("ETag"),
+        "content_length": headers.get("Content-Length"),
+    }
+
+
+def _write_download_meta(
+    meta_file: Path, remote_info: Dict[str, Optional[str]], size: int
+) -> None:
+    """Record the remote headers and local size of a completed download."""
+    try:
+        meta_file.write_text(json.dumps({**remote_info, "size": size}))
+    except OSError as e:
+        log.warning("Could not write download metadata %s: %s", meta_file, e)
+
+
+def _is_unchanged_remote(url: str, local_file: Path, meta_file: Path) -> bool:
+    """Check whether a previous download of ``url`` is still current.
+
+    The local file is considered current when it has the size recorded at
+    download time and a HEAD request reports the same ETag and Content-Length
+    as back then. A matching size alone is not enough, so without an ETag
+    recorded the file always counts as changed, as does any request failure;
+    the caller then falls back to a full download.
+
+    Parameters
+    ----------
+    url : str
+        The URL the file was downloaded from.
+    local_file : Path
+        The previously downloaded file.
+    meta_file : Path
+        Sidecar written by the previous download.
+
+    Returns
+    -------
+    bool
+        True if the download can be skipped, False otherwise.
+
+    """
+    try:
+        recorded = json.loads(meta_file.read_text())
+    except (OSError, ValueError):
+        return False
+    if recorded.get("size") != local_file.stat().st_size:
+        return False
+    if not recorded.get("etag"):
+        return False
+
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        log.debug("HEAD request for %s failed: %s", url, e)
+        return False
+
+    remote_info = _remote_file_info(response.headers)
+    return all(recorded.get(key) == value for key, value in remote_info.items())
+
+
 def download_file(
     url: str,
     dest_folder: str,
     redownload: bool = False,
     filename: str = None,
+    check_remote: bool = False,
 ) -> str:
     """Download a file from HTTP(S) or FTP to the specified destination folder.
 
@@ -358,9 +441,14 @@ def download_file(
     dest_folder : str
         Local folder to save the downloaded file.
     redownload : bool, optional
-        If True, force re-download of the file even if it exists.
+        If True, re-download the file even if it exists.
     filename : str, optional
         Optional filename to save the file as. If not given, uses the name from the URL.
+    check_remote : bool, optional
+        If True and the file exists, an HTTP(S) file is only re-downloaded when
+        a HEAD request shows the remote file changed since the last download
+        (different ETag or Content-Length, or no ETag to compare). Ignored
+        when ``redownload`` is True.
 
     Returns
     -------
@@ -377,19 +465,27 @@ def download_file(
     dest_folder_path.mkdir(parents=True, exist_ok=True)
 
     local_filename = dest_folder_path / (filename or Path(url).name)
+    parsed_url = urlparse(url)
+    is_http = parsed_url.scheme in ("http", "https")
     if local_filename.exists() and not redownload:
         # File exists and redownload not requested
-        return str(local_filename)
-
-    parsed_url = urlparse(url)
-
-    if parsed_url.scheme in ("http", "https"):
-        # HTTP(S) download
-        with requests.get(url, stream=True) as response:
+        if not (check_remote and is_http):
+            return str(local_filename)
+        meta_file = local_filename.with_name(local_filename.name + _META_SUFFIX)
+        if _is_unchanged_remote(url, local_filename, meta_file):
+            log.info("Remote file unchanged, keeping %s", local_filename)
+            return str(local_filename)
+
+    if is_http:
+        meta_file = local_filename.with_name(local_filename.name + _META_SUFFIX)
+        # HTTP(S) download, streamed to disk in large blocks
+        with requests.get(url, stream=True, timeout=_REQUEST_TIMEOUT) as response:
             response.raise_for_status()
+            response.raw.decode_content = True
             with open(local_filename, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+            remote_info = _remote_file_info(response.headers)
+        _write_download_meta(meta_file, remote_info, local_filename.stat().st_size)
 
     elif parsed_url.scheme == "ftp":
         # FTP download
@@ -1,16 +1,134 @@
 from numbers import Number
 from pathlib import Path
+from types import MappingProxyType
 from typing import Union
 
+import netCDF4
 import numpy as np
 import xarray as xr
 
 from amocatlas import logger
 
+# Compression applied to every data variable by save_dataset. Level 1 DEFLATE
+# is several times faster than higher levels for nearly the same size on float
+# fields, and byte shuffling ahead of it is almost free and improves the ratio.
+DEFAULT_COMPRESSION = MappingProxyType({"zlib": True, "complevel": 1, "shuffle": True})
 
-def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
-    """Attempts to save the dataset to a NetCDF file. If a TypeError occurs due to invalid attribute values,
-    it converts the invalid attributes to strings and retries the save operation.
+# Approximate size in bytes of one chunk written by save_dataset.
+_CHUNK_TARGET_BYTES = 1 << 20
+
+
+def _target_chunks(dtype: np.dtype, shape: tuple[int, ...]) -> tuple[int, ...]:
+    """Return the chunk shape of roughly ``_CHUNK_TARGET_BYTES`` for a variable.
+
+    The element budget is spread evenly over the dimensions, so a long 1-D
+    float64 series gets 131072-element chunks and a large 2-D one 362 x 362
+    tiles. Dimensions shorter than their share are stored whole and the budget
+    they leave unused goes to the longer ones, so an (8, 200000) variable is
+    written in 8 x 16384 chunks rather than 8 x 362.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Data type of the variable.
+    shape : tuple of int
+        Shape of the variable; every dimension must be non-empty.
+
+    Returns
+    -------
+    tuple of int
+        Chunk length along each dimension, never longer than the dimension.
+
+    """
+    budget = max(_CHUNK_TARGET_BYTES // max(dtype.itemsize, 1), 1)
+    chunks = [0] * len(shape)
+    # Shortest dimensions first, so whatever they do not use is still left
+    # over for the longer dimensions that follow
+    order = sorted(range(len(shape)), key=lambda axis: shape[axis])
+    for position, axis in enumerate(order):
+        share = max(int(budget ** (1 / (len(shape) - position))), 1)
+        chunks[axis] = min(shape[axis], share)
+        budget = max(budget // chunks[axis], 1)
+    return tuple(chunks)
+
+
+# Data types NETCDF4_CLASSIC can hold, which the direct netCDF4 writer supports
+_FAST_PATH_DTYPES = frozenset(np.dtype(t) for t in ("i1", "i2", "i4", "f4", "f8"))
+# Encoding entries only xarray knows how to apply
+_FAST_PATH_BLOCKING_ENCODING = ("scale_factor", "add_offset")
+
+
+def _save_fast(ds: xr.Dataset, output_file: str, encoding: dict) -> bool:
+    """Write a simple dataset with netCDF4 directly, bypassing xarray's encoders.
+
+    Only datasets whose variables are numeric or datetime, need no packing and
+    have no non-dimension coordinates are handled; anything else is left to
+    ``to_netcdf``. Datetimes are written as float seconds since 1970 using the
+    units from ``encoding``, and floats get a NaN fill value as xarray would.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        The dataset to write, with attributes already sanitized.
+    output_file : str
+        The path to the output NetCDF file.
+    encoding : dict
+        Per-variable encoding as built by :func:`save_dataset`.
+
+    Returns
+    -------
+    bool
+        True if the file was written, False if the dataset is not simple enough
+        for this path (nothing is written in that case).
+
+    """
+    if set(ds.coords) - set(ds.dims):
+        return False
+    for variable in ds.variables.values():
+        if any(key in variable.encoding for key in _FAST_PATH_BLOCKING_ENCODING):
+            return False
+        if np.issubdtype(variable.dtype, np.datetime64):
+            continue
+        target_dtype = np.dtype(variable.encoding.get("dtype", variable.dtype))
+        if variable.dtype not in _FAST_PATH_DTYPES or target_dtype != variable.dtype:
+            return False
+
+    unlimited_dims = set(ds.encoding.get("unlimited_dims", ()))
+    with netCDF4.Dataset(output_file, "w", format="NETCDF4_CLASSIC") as nc:
+        nc.set_auto_maskandscale(False)
+        for dim, size in ds.sizes.items():
+            nc.createDimension(dim, None if dim in unlimited_dims else size)
+
+        for var_name, variable in ds.variables.items():
+            var_encoding = dict(encoding.get(var_name, {}))
+            values = variable.values
+            attrs = dict(variable.attrs)
+            if np.issubdtype(values.dtype, np.datetime64):
+                seconds = (values - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+                values = np.where(np.isnat(values), np.nan, seconds)
+                attrs["units"] = var_encoding.pop("units")
+                attrs["calendar"] = var_encoding.pop("calendar")
+
+            fill_value = np.nan if values.dtype.kind == "f" else None
+            nc_var = nc.createVariable(
+                var_name,
+                values.dtype,
+                variable.dims,
+                fill_value=fill_value,
+                **var_encoding,
+            )
+            nc_var.setncatts(attrs)
+            nc_var[...] = values
+
+        nc.setncatts(ds.attrs)
+    return True
+
+
+def save_dataset(
+    ds: xr.Dataset, output_file: str = "../test.nc", fast_path: bool = False
+) -> bool:
+    """Attempts to save the dataset to a NetCDF file. Variable attributes with values
+    netCDF cannot store are converted to strings before the dataset is written.
 
     Parameters
     ----------
@@ -18,6 +136,10 @@ def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
         The dataset to be saved.
     output_file : str, optional
         The path to the output NetCDF file. Defaults to '../test.nc'.
+    fast_path : bool, optional
+        If True, write simple datasets with netCDF4 directly instead of through
+        xarray's encoding machinery. Datasets the direct writer cannot handle,
+        or any error it raises, fall back to ``to_netcdf``. Defaults to False.
 
     Returns
     -------
@@ -42,68 +164,102 @@ def save_dataset(ds: xr.Dataset, output_file: str = "../test.nc") -> bool:
     # More general
     valid_types = (str, Number, np.ndarray, np.number, list, tuple)
 
-    # Make a copy to avoid modifying the original dataset
-    ds_copy = ds.copy()
-
-    # Sanitize attributes: replace None with empty string to avoid NetCDF issues
-    for k, v in ds_copy.attrs.items():
-        if v is None:
-            ds_copy.attrs[k] = ""
-
-    # Handle datetime coordinate encoding conflicts
-    # For datetime variables, remove manual units to let xarray handle encoding properly
-    conflicting_keys = ["units", "calendar"]
-    for var_name, variable in ds_copy.variables.items():
-        if variable.dtype == np.dtype("datetime64[ns]"):
+    # Build the encoding in a single pass over the variables: datetime
+    # variables get fixed units, data variables get compression and chunking. Any
+    # units/calendar attributes on datetime variables would clash with that
+    # encoding, so those variables are noted for the attributes to be dropped.
+    conflicting_keys = ("units", "calendar")
+    encoding = {}
+    clashing_vars = []
+    for var_name, variable in ds.variables.items():
+        var_encoding = {}
+        if np.issubdtype(variable.dtype, np.datetime64):
             logger.log_info(
                 f"Configuring datetime encoding for variable '{var_name}' - removing manual units"
             )
+            var_encoding.update(
+                units="seconds since 1970-01-01T00:00:00Z", calendar="gregorian"
+            )
+            if any(key in variable.attrs for key in conflicting_keys):
+                clashing_vars.append(var_name)
+        if var_name in ds.data_vars:
+            var_encoding.update(DEFAULT_COMPRESSION)
+            # Explicit ~1 MB chunks let readers pull a slice without
+            # decompressing the whole variable. Strings are stored with an
+            # extra character dimension, so they keep the library default.
+            if (
+                variable.ndim
+                and all(variable.shape)
+                and np.issubdtype(variable.dtype, np.number)
+            ):
+                var_encoding["chunksizes"] = _target_chunks(
+                    variable.dtype, variable.shape
+                )
+        if var_encoding:
+            encoding[var_name] = var_encoding
 
-            # Remove conflicting attributes that may clash with encoding
-            for key in conflicting_keys:
-                if key in ds_copy[var_name].attrs:
-                    del ds_copy[var_name].attrs[key]
+    # Scan the attributes once before writing: variable attributes that
+    # netCDF cannot store are converted to strings, so the dataset is written
+    # in a single pass instead of failing and being written again. Global
+    # attributes are only relieved of None values; anything else that is
+    # invalid there still makes the save fail below.
+    invalid_var_attrs = [
+        (var_name, key)
+        for var_name, variable in ds.variables.items()
+        for key, value in variable.attrs.items()
+        if not isinstance(value, valid_types) or isinstance(value, bool)
+    ]
 
-            # Set proper datetime encoding
-            if var_name not in ds_copy.encoding:
-                ds_copy.encoding[var_name] = {}
-            ds_copy.encoding[var_name].update(
-                {"units": "seconds since 1970-01-01T00:00:00Z", "calendar": "gregorian"}
-            )
+    # Only take a (shallow) copy when attributes have to change, so the
+    # original dataset is never modified
+    needs_copy = (
+        bool(clashing_vars)
+        or bool(invalid_var_attrs)
+        or any(v is None for v in ds.attrs.values())
+    )
+    ds_copy = ds.copy() if needs_copy else ds
 
-    # Set up compression encoding for data variables
-    encoding = {}
-    for var in ds_copy.data_vars:
-        encoding[var] = {"zlib": True, "complevel": 4}
+    # Sanitize attributes: replace None with empty string to avoid NetCDF issues.
+    # Without a copy there are no None values, and the caller's attrs stay put.
+    if needs_copy:
+        ds_copy.attrs = {k: ("" if v is None else v) for k, v in ds_copy.attrs.items()}
+
+    for var_name, k in invalid_var_attrs:
+        attrs = ds_copy.variables[var_name].attrs
+        v = attrs[k]
+        print(
+            f"variable '{var_name}': Converting attribute '{k}' with value '{v}' to string.",
+        )
+        attrs[k] = str(v)
+
+    for var_name in clashing_vars:
+        attrs = ds_copy.variables[var_name].attrs
+        for key in conflicting_keys:
+            attrs.pop(key, None)
+
+    if fast_path:
+        try:
+            if _save_fast(ds_copy, output_file, encoding):
+                return True
+        except Exception as e:
+            logger.log_warning(
+                f"Direct netCDF4 write failed, falling back to xarray: {e}"
+            )
 
     try:
         ds_copy.to_netcdf(output_file, format="NETCDF4_CLASSIC", encoding=encoding)
         return True
     except TypeError as e:
-        print(e.__class__.__name__, e)
-        for varname, variable in ds_copy.variables.items():
-            for k, v in variable.attrs.items():
-                if not isinstance(v, valid_types) or isinstance(v, bool):
-                    print(
-                        f"variable '{varname}': Converting attribute '{k}' with value '{v}' to string.",
-                    )
-                    variable.attrs[k] = str(v)
-        try:
-            ds_copy.to_netcdf(output_file, format="NETCDF4_CLASSIC", encoding=encoding)
-            return True
-        except Exception as e:
-            print("Failed to save dataset:", e)
-            datetime_vars = [
-                var
-                for var in ds_copy.variables
-                if ds_copy[var].dtype == "datetime64[ns]"
-            ]
-            print("Variables with dtype datetime64[ns]:", datetime_vars)
-            float_attrs = [
-                attr for attr in ds_copy.attrs if isinstance(ds_copy.attrs[attr], float)
-            ]
-            print("Attributes with dtype float64:", float_attrs)
-            return False
+        print("Failed to save dataset:", e)
+        datetime_vars = [
+            var for var in ds_copy.variables if ds_copy[var].dtype == "datetime64[ns]"
+        ]
+        print("Variables with dtype datetime64[ns]:", datetime_vars)
+        float_attrs = [
+            attr for attr in ds_copy.attrs if isinstance(ds_copy.attrs[attr], float)
+        ]
+        print("Attributes with dtype float64:", float_attrs)
+        return False
 
 
 def save_AC1_dataset(ds: xr.Dataset, data_dir: Union[str, Path]) -> Path:
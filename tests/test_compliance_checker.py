@@ -3,25 +3,53 @@
 import pytest
 import xarray as xr
 import numpy as np
-import tempfile
-import os
+from pathlib import Path
+from typing import Callable
 
 from amocatlas import compliance_checker, logger
 
-# Disable logging for tests
-logger.disable_logging()
-
 # Test data file - a valid AC1 file for testing modifications
 TEST_AC1_FILE = "data/OS_TEST_20040402-20240327_DPR_transports_T12H.nc"
 
+# OceanSITES filename used when validating modified datasets in memory
+VALID_FILENAME = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
+
+# OceanSITES filename matching the time span of the reference AC1 file, under
+# which the unmodified reference dataset passes
+REFERENCE_FILENAME = "OS_RAPID_20040402-20240327_DPR_transports_T12H.nc"
+
+# Scratch files only need to be readable by the checker; the scipy netCDF3
+# writer avoids the HDF5 setup cost of NETCDF4_CLASSIC for these tiny files
+SCRATCH_NETCDF = {"engine": "scipy", "format": "NETCDF3_64BIT"}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _silence() -> None:
+    """Disable logging for this module's tests, restoring the previous state."""
+    was_enabled = logger.LOGGING_ENABLED
+    logger.disable_logging()
+    yield
+    if was_enabled:
+        logger.enable_logging()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def base_ac1_ds() -> xr.Dataset:
+    """Load the reference AC1 file once per session.
+
+    Tests take shallow copies, which get their own global and variable
+    attribute dicts, so the shared dataset is never modified.
+    """
+    with xr.open_dataset(TEST_AC1_FILE) as ds:
+        yield ds.load()
+
+
+@pytest.fixture(scope="session")
 def valid_ac1_dataset() -> xr.Dataset:
-    """Create a valid AC1 dataset for testing."""
-    time_data = np.array(
-        ["2004-04-02T00:00:00", "2004-04-02T12:00:00", "2004-04-03T00:00:00"],
-        dtype="datetime64[ns]",
-    )
+    """Create a valid AC1 dataset for testing, shared across the session."""
+    # 12-hourly from 2004-04-02T00 to 2004-04-03T00
+    time_start = np.datetime64("2004-04-02T00:00:00", "ns")
+    time_data = time_start + np.arange(3) * np.timedelta64(12, "h")
 
     # Create 8 transport components as required
     component_names = [
@@ -38,7 +66,7 @@ def valid_ac1_dataset() -> xr.Dataset:
     ds = xr.Dataset(
         {
             "TRANSPORT": xr.DataArray(
-                np.random.random((8, 3)),
+                np.zeros((8, 3), dtype=np.float32),
                 dims=["N_COMPONENT", "TIME"],
                 attrs={
                     "long_name": "Ocean volume transport",
@@ -48,7 +76,7 @@ def valid_ac1_dataset() -> xr.Dataset:
                 },
             ),
             "MOC_TRANSPORT": xr.DataArray(
-                np.random.random(3),
+                np.zeros(3, dtype=np.float32),
                 dims=["TIME"],
                 attrs={
                     "long_name": "Maximum meridional overturning circulation transport",
@@ -65,7 +93,7 @@ def valid_ac1_dataset() -> xr.Dataset:
                 },
             ),
             "TRANSPORT_DESCRIPTION": xr.DataArray(
-                [f"{name} transport component" for name in component_names],
+                list(map("{} transport component".format, component_names)),
                 dims=["N_COMPONENT"],
                 attrs={
                     "long_name": "Transport component descriptions",
@@ -131,179 +159,130 @@ def valid_ac1_dataset() -> xr.Dataset:
         },
     )
 
-    return ds
-
-
-@pytest.fixture
-def temp_netcdf_file(valid_ac1_dataset: xr.Dataset) -> str:
-    """Create a temporary NetCDF file with valid AC1 dataset."""
-    # Create proper OceanSITES filename in temp directory
-    temp_dir = tempfile.gettempdir()
-    proper_name = os.path.join(
-        temp_dir, "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-    )
-
-    # Remove manual units from TIME to avoid encoding conflicts
-    ds = valid_ac1_dataset.copy()
-    if "units" in ds["TIME"].attrs:
-        del ds["TIME"].attrs["units"]
-
-    # Set encoding for datetime
+    # Datetime encoding for files written from this dataset; manual TIME units
+    # would conflict with it
+    ds["TIME"].attrs.pop("units", None)
     ds.encoding["TIME"] = {
         "units": "seconds since 1970-01-01T00:00:00Z",
         "calendar": "gregorian",
     }
 
-    ds.to_netcdf(proper_name, format="NETCDF4_CLASSIC")
-    yield proper_name
+    return ds
+
+
+@pytest.fixture(scope="session")
+def valid_netcdf_path(
+    valid_ac1_dataset: xr.Dataset, tmp_path_factory: pytest.TempPathFactory
+) -> str:
+    """Write the valid AC1 dataset to disk once per session.
+
+    Tests must only read this file; anything that needs a modified file writes
+    its own under ``tmp_path``.
+    """
+    # Proper OceanSITES filename in a directory unique to this session, so
+    # parallel workers never share a path
+    proper_name = str(tmp_path_factory.mktemp("ac1") / VALID_FILENAME)
 
-    # Cleanup
-    if os.path.exists(proper_name):
-        os.unlink(proper_name)
+    valid_ac1_dataset.to_netcdf(proper_name, **SCRATCH_NETCDF)
+    return proper_name
 
 
 class TestComplianceChecker:
     """Test compliance checker functionality."""
 
-    def test_valid_file_passes(self, temp_netcdf_file: str) -> None:
+    def test_valid_file_passes(self, valid_netcdf_path: str) -> None:
         """Test that a valid AC1 file passes compliance check."""
-        result = compliance_checker.validate_ac1_file(temp_netcdf_file)
+        result = compliance_checker.validate_ac1_file(valid_netcdf_path)
 
         assert result.passed, f"Valid file should pass. Errors: {result.errors}"
         assert result.file_type == "component_transports"
         assert len(result.errors) == 0
 
-    def test_missing_required_global_attributes(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of missing required global attributes."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
+    def test_xarray_fallback_matches_netcdf4(self, valid_netcdf_path: str) -> None:
+        """Test that the xarray fallback path gives the same result as netCDF4."""
+        result_nc = compliance_checker.validate_ac1_file(valid_netcdf_path)
+        result_xr = compliance_checker.validate_ac1_file(
+            valid_netcdf_path, use_xarray=True
+        )
 
-        # Remove a required attribute
-        ds_modified = ds.copy()
-        del ds_modified.attrs["title"]
-        ds.close()
+        assert result_nc.passed == result_xr.passed
+        assert result_nc.file_type == result_xr.file_type
+        assert result_nc.errors == result_xr.errors
+        assert result_nc.warnings == result_xr.warnings
+
+    def test_validate_dataset_matches_file(
+        self, valid_ac1_dataset: xr.Dataset, valid_netcdf_path: str
+    ) -> None:
+        """Test that in-memory validation matches validating the written file."""
+        result_file = compliance_checker.validate_ac1_file(valid_netcdf_path)
+        result_ds = compliance_checker.validate_ac1_dataset(
+            valid_ac1_dataset, VALID_FILENAME
+        )
 
-        # Use proper OceanSITES filename pattern
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        assert result_ds.passed == result_file.passed
+        assert result_ds.file_type == result_file.file_type
+        assert result_ds.errors == result_file.errors
+        assert result_ds.warnings == result_file.warnings
 
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+    def test_validate_files_parallel(
+        self, tmp_path: Path, valid_netcdf_path: str
+    ) -> None:
+        """Test that validate_files matches validate_file for each path."""
+        invalid_path = str(tmp_path / "invalid_filename.nc")
+        filepaths = [valid_netcdf_path, invalid_path]
 
-            assert not result.passed
-            assert any(
-                "Missing required global attribute: title" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_invalid_filename_pattern(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of invalid filename patterns."""
-        # Load actual AC1 file
-        ds = xr.open_dataset(TEST_AC1_FILE)
+        results = compliance_checker.AC1ComplianceChecker.validate_files(
+            filepaths, workers=2
+        )
+
+        assert list(results) == filepaths
+        assert results[valid_netcdf_path].passed
+        assert results[valid_netcdf_path].file_type == "component_transports"
+        assert not results[invalid_path].passed
 
+    def test_invalid_filename_pattern(self, base_ac1_ds: xr.Dataset) -> None:
+        """Test detection of invalid filename patterns."""
         # Use invalid filename pattern
-        filename = "invalid_filename.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        result = compliance_checker.validate_ac1_dataset(
+            base_ac1_ds, "invalid_filename.nc"
+        )
+        errors_text = "\n".join(result.errors)
 
-        try:
-            ds.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        assert not result.passed
+        assert (
+            "does not match OceanSITES pattern" in errors_text
+            or "Filename must follow OceanSITES pattern" in errors_text
+        )
 
-            assert not result.passed
-            assert any(
-                "does not match OceanSITES pattern" in error
-                or "Filename must follow OceanSITES pattern" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds.close()
-
-    def test_missing_required_dimensions(self, valid_ac1_dataset: xr.Dataset) -> None:
+    def test_missing_required_dimensions(self, base_ac1_ds: xr.Dataset) -> None:
         """Test detection of missing required dimensions."""
-        # Load actual AC1 file and remove TIME dimension
-        ds = xr.open_dataset(TEST_AC1_FILE)
-
         # Create dataset without TIME dimension
-        ds_no_time = ds.isel(TIME=0).drop_vars("TIME")
-        ds.close()
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
-
-        try:
-            ds_no_time.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        ds_no_time = base_ac1_ds.isel(TIME=0).drop_vars("TIME")
 
-            assert not result.passed
-            assert any("TIME dimension is required" in error for error in result.errors)
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_no_time.close()
-
-    def test_missing_variable_attributes(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of missing variable attributes."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
-
-        # Remove long_name from TRANSPORT
-        del ds_modified["TRANSPORT"].attrs["long_name"]
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        result = compliance_checker.validate_ac1_dataset(ds_no_time, VALID_FILENAME)
+        errors_text = "\n".join(result.errors)
 
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        assert not result.passed
+        assert "TIME dimension is required" in errors_text
 
-            assert not result.passed
-            assert any(
-                "TRANSPORT missing required attribute: long_name" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_datetime_coordinate_units_not_required(self, valid_ac1_dataset: xr.Dataset) -> None:
+    def test_datetime_coordinate_units_not_required(
+        self, valid_netcdf_path: str
+    ) -> None:
         """Test that TIME coordinate doesn't require manual units attribute."""
-        ds = valid_ac1_dataset.copy()
-        # TIME coordinate should not have manual units (xarray handles this)
-        if "units" in ds["TIME"].attrs:
-            del ds["TIME"].attrs["units"]
-
-        with tempfile.NamedTemporaryFile(
-            suffix="_OS_RAPID_20040402-20040403_DPR_transports_T12H.nc", delete=False
-        ) as tmp:
-            ds.encoding["TIME"] = {
-                "units": "seconds since 1970-01-01T00:00:00Z",
-                "calendar": "gregorian",
-            }
-            ds.to_netcdf(tmp.name, format="NETCDF4_CLASSIC")
-
-            result = compliance_checker.validate_ac1_file(tmp.name)
-
-            # Should pass - datetime coordinates don't need manual units
-            time_units_errors = [
-                error for error in result.errors if "TIME" in error and "units" in error
-            ]
-            assert (
-                len(time_units_errors) == 0
-            ), f"TIME should not require manual units. Errors: {time_units_errors}"
-
-        os.unlink(tmp.name)
-
-    def test_unitless_variables_allowed(self, valid_ac1_dataset: xr.Dataset) -> None:
+        # The shared valid file is written with TIME units only in the encoding
+        result = compliance_checker.validate_ac1_file(valid_netcdf_path)
+
+        # Should pass - datetime coordinates don't need manual units
+        time_units_errors = [
+            error for error in result.errors if "TIME" in error and "units" in error
+        ]
+        assert (
+            len(time_units_errors) == 0
+        ), f"TIME should not require manual units. Errors: {time_units_errors}"
+
+    def test_unitless_variables_allowed(
+        self, tmp_path: Path, valid_ac1_dataset: xr.Dataset
+    ) -> None:
         """Test that descriptive variables don't require units."""
         ds = valid_ac1_dataset.copy()
         # TRANSPORT_NAME and TRANSPORT_DESCRIPTION should not require units
@@ -312,169 +291,134 @@ class TestComplianceChecker:
         if "units" in ds["TRANSPORT_DESCRIPTION"].attrs:
             del ds["TRANSPORT_DESCRIPTION"].attrs["units"]
 
-        with tempfile.NamedTemporaryFile(
-            suffix="_OS_RAPID_20040402-20040403_DPR_transports_T12H.nc", delete=False
-        ) as tmp:
-            if "units" in ds["TIME"].attrs:
-                del ds["TIME"].attrs["units"]
-            ds.encoding["TIME"] = {
-                "units": "seconds since 1970-01-01T00:00:00Z",
-                "calendar": "gregorian",
-            }
-            ds.to_netcdf(tmp.name, format="NETCDF4_CLASSIC")
-
-            result = compliance_checker.validate_ac1_file(tmp.name)
-
-            # Should not require units for descriptive variables
-            name_units_errors = [
-                error
-                for error in result.errors
-                if "TRANSPORT_NAME" in error and "units" in error
-            ]
-            desc_units_errors = [
-                error
-                for error in result.errors
-                if "TRANSPORT_DESCRIPTION" in error and "units" in error
-            ]
-
-            assert (
-                len(name_units_errors) == 0
-            ), f"TRANSPORT_NAME should not require units. Errors: {name_units_errors}"
-            assert (
-                len(desc_units_errors) == 0
-            ), f"TRANSPORT_DESCRIPTION should not require units. Errors: {desc_units_errors}"
-
-        os.unlink(tmp.name)
-
-    def test_invalid_data_mode(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of invalid data_mode values."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
-
-        ds_modified.attrs["data_mode"] = "INVALID"
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
-
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any(
-                "data_mode must be one of ['R', 'P', 'D']" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_invalid_qc_indicator(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of invalid QC_indicator values."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
-
-        ds_modified.attrs["QC_indicator"] = "invalid"
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
-
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any(
-                "QC_indicator must be one of" in error for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_invalid_date_format(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of invalid date formats."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
-
-        ds_modified.attrs["date_created"] = "2025-10-05T14:30:00Z"  # Wrong format
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
-
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any(
-                "date_created must use format YYYYmmddTHHMMss" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_invalid_orcid_format(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of invalid ORCID formats."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
-
-        ds_modified.attrs["contributor_id"] = "https://orcid.org/invalid-format"
-
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
-
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any("Invalid ORCID format" in error for error in result.errors)
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_missing_conventions(self, valid_ac1_dataset: xr.Dataset) -> None:
-        """Test detection of missing conventions."""
-        # Load actual AC1 file and modify it
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
+        filepath = str(tmp_path / VALID_FILENAME)
+        ds.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
+
+        # Should not require units for descriptive variables
+        name_units_errors = [
+            error
+            for error in result.errors
+            if "TRANSPORT_NAME" in error and "units" in error
+        ]
+        desc_units_errors = [
+            error
+            for error in result.errors
+            if "TRANSPORT_DESCRIPTION" in error and "units" in error
+        ]
+
+        assert (
+            len(name_units_errors) == 0
+        ), f"TRANSPORT_NAME should not require units. Errors: {name_units_errors}"
+        assert (
+            len(desc_units_errors) == 0
+        ), f"TRANSPORT_DESCRIPTION should not require units. Errors: {desc_units_errors}"
+
+    @pytest.mark.parametrize(
+        ("mutate", "expected"),
+        [
+            pytest.param(
+                lambda ds: ds.attrs.pop("title"),
+                "Missing required global attribute: title",
+                id="missing_title",
+            ),
+            pytest.param(
+                lambda ds: ds["TRANSPORT"].attrs.pop("long_name"),
+                "TRANSPORT missing required attribute: long_name",
+                id="missing_long_name",
+            ),
+            pytest.param(
+                lambda ds: ds.attrs.update(data_mode="INVALID"),
+                "data_mode must be one of ['R', 'P', 'D']",
+                id="data_mode",
+            ),
+            pytest.param(
+                lambda ds: ds.attrs.update(QC_indicator="invalid"),
+                "QC_indicator must be one of",
+                id="qc_indicator",
+            ),
+            pytest.param(
+                lambda ds: ds.attrs.update(date_created="2025-10-05T14:30:00Z"),
+                "date_created must use format YYYYmmddTHHMMss",
+                id="date_format",
+            ),
+            pytest.param(
+                lambda ds: ds.attrs.update(
+                    contributor_id="https://orcid.org/invalid-format"
+                ),
+                "Invalid ORCID format",
+                id="orcid_format",
+            ),
+            # Missing OceanSITES and ACDD
+            pytest.param(
+                lambda ds: ds.attrs.update(Conventions="CF-1.8"),
+                "Conventions must include 'OceanSITES-1.4'",
+                id="conventions_oceansites",
+            ),
+            pytest.param(
+                lambda ds: ds.attrs.update(Conventions="CF-1.8"),
+                "Conventions must include 'ACDD-1.3'",
+                id="conventions_acdd",
+            ),
+        ],
+    )
+    def test_attribute_violations(
+        self,
+        base_ac1_ds: xr.Dataset,
+        mutate: Callable[[xr.Dataset], object],
+        expected: str,
+    ) -> None:
+        """Test detection of missing or invalid attributes."""
+        # A shallow copy has its own global and variable attribute dicts, so
+        # mutating them leaves the shared reference dataset untouched
+        ds_modified = base_ac1_ds.copy()
+        baseline = compliance_checker.validate_ac1_dataset(
+            ds_modified, REFERENCE_FILENAME
+        )
+        assert baseline.passed, f"Baseline should pass. Errors: {baseline.errors}"
 
-        ds_modified.attrs["Conventions"] = "CF-1.8"  # Missing OceanSITES and ACDD
+        mutate(ds_modified)
 
-        filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        result = compliance_checker.validate_ac1_dataset(
+            ds_modified, REFERENCE_FILENAME
+        )
+        errors_text = "\n".join(result.errors)
 
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        assert not result.passed
+        assert expected in errors_text
+
+    @pytest.mark.parametrize(
+        ("attrs", "expected"),
+        [
+            pytest.param(
+                {"date_created": "2025-10-05T14:30:00Z"},
+                "date_created must use format YYYYmmddTHHMMss",
+                id="date_format",
+            ),
+            pytest.param(
+                {"Conventions": "CF-1.8"},
+                "Conventions must include 'OceanSITES-1.4'",
+                id="conventions_oceansites",
+            ),
+        ],
+    )
+    def test_attribute_violations_in_file(
+        self,
+        base_ac1_ds: xr.Dataset,
+        tmp_path: Path,
+        attrs: dict[str, str],
+        expected: str,
+    ) -> None:
+        """Test that attribute violations are also found when validating a file."""
+        ds_modified = base_ac1_ds.copy()
+        ds_modified.attrs.update(attrs)
+        filepath = str(tmp_path / REFERENCE_FILENAME)
+        ds_modified.to_netcdf(filepath, **SCRATCH_NETCDF)
+
+        result = compliance_checker.validate_ac1_file(filepath)
 
-            assert not result.passed
-            assert any(
-                "Conventions must include 'OceanSITES-1.4'" in error
-                for error in result.errors
-            )
-            assert any(
-                "Conventions must include 'ACDD-1.3'" in error
-                for error in result.errors
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
+        assert not result.passed
+        assert expected in "\n".join(result.errors)
 
 
 class TestValidationResult:
@@ -509,134 +453,164 @@ class TestValidationResult:
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
-    def test_invalid_netcdf_file(self) -> None:
+    def test_invalid_netcdf_file(self, tmp_path: Path) -> None:
         """Test validation of invalid NetCDF file."""
         # Create a non-NetCDF file with proper naming
         filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = str(tmp_path / filename)
 
-        try:
-            # Write invalid content
-            with open(filepath, 'w') as f:
-                f.write("This is not a NetCDF file")
+        # Write invalid content
+        with open(filepath, "w") as f:
+            f.write("This is not a NetCDF file")
 
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any("Failed to open NetCDF file" in error for error in result.errors)
+        result = compliance_checker.validate_ac1_file(filepath)
+        errors_text = "\n".join(result.errors)
 
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
+        assert not result.passed
+        assert "Failed to open NetCDF file" in errors_text
 
-    def test_invalid_filename_dates(self) -> None:
+    def test_invalid_filename_dates(self, base_ac1_ds: xr.Dataset) -> None:
         """Test validation with invalid date format in filename."""
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_copy = ds.copy()
-        ds.close()
-
         # Create filename with invalid date format
         filename = "OS_RAPID_20040432-20040403_DPR_transports_T12H.nc"  # 32nd day doesn't exist
-        filepath = os.path.join(tempfile.gettempdir(), filename)
 
-        try:
-            ds_copy.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
-
-            assert not result.passed
-            assert any("Invalid date format in filename" in error for error in result.errors)
+        result = compliance_checker.validate_ac1_dataset(base_ac1_ds, filename)
+        errors_text = "\n".join(result.errors)
 
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_copy.close()
+        assert not result.passed
+        assert "Invalid date format in filename" in errors_text
 
-    def test_start_date_after_end_date(self) -> None:
+    def test_start_date_after_end_date(self, base_ac1_ds: xr.Dataset) -> None:
         """Test validation when start date is after end date."""
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_copy = ds.copy()
-        ds.close()
-
         # Create filename with start date after end date
         filename = "OS_RAPID_20040405-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
 
-        try:
-            ds_copy.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        result = compliance_checker.validate_ac1_dataset(base_ac1_ds, filename)
 
-            assert not result.passed
-            assert any("Start date" in error and "must be <= end date" in error for error in result.errors)
+        assert not result.passed
+        assert any(
+            "Start date" in error and "must be <= end date" in error
+            for error in result.errors
+        )
+
+    def test_time_outside_filename_range(self, base_ac1_ds: xr.Dataset) -> None:
+        """Test that TIME values outside the filename date range are detected."""
+        # Reference data spans 2004-2024 but the filename claims two days
+        result = compliance_checker.validate_ac1_dataset(base_ac1_ds, VALID_FILENAME)
+
+        assert not result.passed
+        assert "TIME values must fall within filename date range" in result.errors
+
+    def test_values_outside_valid_range_warning(
+        self, tmp_path: Path, base_ac1_ds: xr.Dataset
+    ) -> None:
+        """Test that valid_min/valid_max are checked while ignoring NaNs."""
+        ds_modified = base_ac1_ds.copy()
+
+        time_size = ds_modified.sizes["TIME"]
+        out_of_range = np.full(time_size, np.nan)
+        out_of_range[0] = 50.0
+        ds_modified["OUT_OF_RANGE"] = xr.DataArray(
+            out_of_range,
+            dims=["TIME"],
+            attrs={
+                "long_name": "Out of range",
+                "units": "1",
+                "valid_min": -10.0,
+                "valid_max": 10.0,
+            },
+        )
+        ds_modified["ALL_MISSING"] = xr.DataArray(
+            np.full(time_size, np.nan),
+            dims=["TIME"],
+            attrs={
+                "long_name": "All missing",
+                "units": "1",
+                "valid_min": -10.0,
+                "valid_max": 10.0,
+            },
+        )
+
+        filename = REFERENCE_FILENAME
+        filepath = str(tmp_path / filename)
 
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_copy.close()
+        ds_modified.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
 
-    def test_non_standard_units_warning(self) -> None:
+        range_warnings = [w for w in result.warnings if "outside valid range" in w]
+        assert range_warnings == [
+            "Variable OUT_OF_RANGE has values outside valid range [-10.0, 10.0]"
+        ]
+
+    def test_coordinate_outside_range(
+        self, tmp_path: Path, base_ac1_ds: xr.Dataset
+    ) -> None:
+        """Test that coordinate values outside the allowed range are detected."""
+        ds_modified = base_ac1_ds.copy()
+
+        ds_modified = ds_modified.assign_coords(
+            LATITUDE=("LATITUDE", [95.0], ds_modified["LATITUDE"].attrs)
+        )
+
+        filename = REFERENCE_FILENAME
+        filepath = str(tmp_path / filename)
+
+        ds_modified.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
+
+        assert not result.passed
+        assert "LATITUDE values must be between -90 and 90" in result.errors
+
+    def test_non_standard_units_warning(
+        self, tmp_path: Path, base_ac1_ds: xr.Dataset
+    ) -> None:
         """Test that non-standard units generate warnings."""
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
+        ds_modified = base_ac1_ds.copy()
 
         # Create variable with unknown standard_name, matching TIME dimension size
         time_size = ds_modified.sizes["TIME"]
         ds_modified["CUSTOM_VAR"] = xr.DataArray(
             np.ones(time_size),
             dims=["TIME"],
-            attrs={
-                "standard_name": "unknown_standard_name",
-                "units": "unknown_units"
-            }
+            attrs={"standard_name": "unknown_standard_name", "units": "unknown_units"},
         )
 
         filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = str(tmp_path / filename)
 
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        ds_modified.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
 
-            # Should still pass but have warnings
-            assert result.passed or len(result.warnings) > 0
-            assert any("Unknown standard_name" in warning for warning in result.warnings)
+        # Should still pass but have warnings
+        assert result.passed or len(result.warnings) > 0
+        assert any("Unknown standard_name" in warning for warning in result.warnings)
 
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
-
-    def test_units_validation_multiple_acceptable(self) -> None:
+    def test_units_validation_multiple_acceptable(
+        self, tmp_path: Path, base_ac1_ds: xr.Dataset
+    ) -> None:
         """Test units validation with multiple acceptable units."""
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
+        ds_modified = base_ac1_ds.copy()
 
         # Modify a variable to have wrong units (for a standard_name that has alternatives)
         if "TRANSPORT" in ds_modified.data_vars:
             ds_modified["TRANSPORT"].attrs["units"] = "wrong_units"
 
         filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = str(tmp_path / filename)
 
-        try:
-            ds_modified.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        ds_modified.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
+        errors_text = "\n".join(result.errors)
 
-            assert not result.passed
-            # Should have error about non-compliant units
-            assert any("Non-compliant units" in error for error in result.errors)
-
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            ds_modified.close()
+        assert not result.passed
+        # Should have error about non-compliant units
+        assert "Non-compliant units" in errors_text
 
 
 class TestSpecificValidations:
     """Test specific validation functions."""
 
-    def test_unknown_file_type_detection(self) -> None:
+    def test_unknown_file_type_detection(self, tmp_path: Path) -> None:
         """Test handling of unknown file types."""
         # Create dataset with minimal structure that doesn't match known patterns
         ds = xr.Dataset(
@@ -647,30 +621,88 @@ class TestSpecificValidations:
                 "format_version": "1.4",
                 "data_type": "OceanSITES time-series data",
                 "title": "Unknown data type",
-                "source": "test"
-            }
+                "source": "test",
+            },
         )
 
         # Use filename that doesn't match specific patterns
         filename = "OS_UNKNOWN_20040402-20040403_DPR_unknown_T12H.nc"
-        filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = str(tmp_path / filename)
 
-        try:
-            ds.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-            result = compliance_checker.validate_ac1_file(filepath)
+        ds.to_netcdf(filepath, **SCRATCH_NETCDF)
+        result = compliance_checker.validate_ac1_file(filepath)
+
+        # May pass or fail, but should handle unknown file type gracefully
+        assert isinstance(result, compliance_checker.ValidationResult)
+
+    def test_file_patterns_used_without_partx_lookup(
+        self, valid_netcdf_path: str
+    ) -> None:
+        """Test that file types resolve from file_patterns when no lookup is given."""
+        array_specs = {
+            k: v
+            for k, v in compliance_checker.RAPID_SPECS.items()
+            if k != "partx_to_type"
+        }
+        result = compliance_checker.validate_ac1_file(valid_netcdf_path, array_specs)
+
+        assert result.file_type == "component_transports"
+        assert result.passed, f"Valid file should pass. Errors: {result.errors}"
+
+    def test_derived_specs_cached_per_array_specs(self) -> None:
+        """Test that checkers built from equal specs share derived structures."""
+        checker_a = compliance_checker.AC1ComplianceChecker()
+        checker_b = compliance_checker.AC1ComplianceChecker(
+            compliance_checker.RAPID_SPECS
+        )
+        checker_c = compliance_checker.AC1ComplianceChecker(
+            compliance_checker.create_array_specs_template()
+        )
 
-            # May pass or fail, but should handle unknown file type gracefully
-            assert isinstance(result, compliance_checker.ValidationResult)
+        assert checker_a._file_type_re is checker_b._file_type_re
+        assert checker_a._file_type_re is not checker_c._file_type_re
 
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
+        # Equal content shares the build; content changed in place does not
+        specs = {
+            **compliance_checker.RAPID_SPECS,
+            "file_patterns": dict(compliance_checker.RAPID_SPECS["file_patterns"]),
+        }
+        checker_d = compliance_checker.AC1ComplianceChecker(specs)
+        assert checker_d._file_type_re is checker_a._file_type_re
 
-    def test_dimension_validation_errors(self) -> None:
+        specs["file_patterns"]["extra"] = r"^OS_EXTRA_.*\.nc$"
+        checker_e = compliance_checker.AC1ComplianceChecker(specs)
+        assert "extra" in checker_e._file_types
+        assert "extra" not in checker_d._file_types
+
+    def test_decoded_time_checked_against_filename(
+        self, valid_ac1_dataset: xr.Dataset
+    ) -> None:
+        """Test that datetime64 TIME is range-checked without CF units."""
+        checker = compliance_checker.AC1ComplianceChecker()
+
+        result = compliance_checker.ValidationResult(passed=True)
+        checker._validate_data_values(
+            valid_ac1_dataset,
+            "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc",
+            result,
+        )
+        assert result.errors == []
+        assert result.warnings == []
+
+        result = compliance_checker.ValidationResult(passed=True)
+        checker._validate_data_values(
+            valid_ac1_dataset,
+            "OS_RAPID_20040402-20040402_DPR_transports_T12H.nc",
+            result,
+        )
+        assert "TIME values must fall within filename date range" in result.errors
+
+    def test_dimension_validation_errors(
+        self, tmp_path: Path, base_ac1_ds: xr.Dataset
+    ) -> None:
         """Test dimension validation edge cases."""
-        ds = xr.open_dataset(TEST_AC1_FILE)
-        ds_modified = ds.copy()
-        ds.close()
+        ds_modified = base_ac1_ds.copy()
 
         # Remove required dimension
         if "TIME" in ds_modified.dims:
@@ -682,26 +714,16 @@ class TestSpecificValidations:
                     continue
                 new_data[var_name] = var
 
-            ds_no_time = xr.Dataset(
-                new_data,
-                attrs=ds_modified.attrs
-            )
+            ds_no_time = xr.Dataset(new_data, attrs=ds_modified.attrs)
 
             filename = "OS_RAPID_20040402-20040403_DPR_transports_T12H.nc"
-            filepath = os.path.join(tempfile.gettempdir(), filename)
+            filepath = str(tmp_path / filename)
 
-            try:
-                ds_no_time.to_netcdf(filepath, format="NETCDF4_CLASSIC")
-                result = compliance_checker.validate_ac1_file(filepath)
-
-                assert not result.passed
-                # Should have error about missing TIME dimension
-
-            finally:
-                if os.path.exists(filepath):
-                    os.unlink(filepath)
+            ds_no_time.to_netcdf(filepath, **SCRATCH_NETCDF)
+            result = compliance_checker.validate_ac1_file(filepath)
 
-        ds_modified.close()
+            assert not result.passed
+            # Should have error about missing TIME dimension
 
 
 class TestValidationResultProperties:
@@ -733,8 +755,7 @@ class TestValidationResultProperties:
     def test_validation_result_attributes(self) -> None:
         """Test ValidationResult attribute initialization."""
         result = compliance_checker.ValidationResult(
-            file_type="test_type",
-            passed=False
+            file_type="test_type", passed=False
         )
 
         assert result.file_type == "test_type"
@@ -49,6 +49,17 @@ def test_enrich_contributor_ids():
     assert result["contributor_role"] == "author"
 
 
+def test_enrich_contributor_ids_array_name_case_insensitive():
+    """Test that the ORCID lookup ignores the case of the array name."""
+    attrs = {"contributor_name": "Ben Moat, Ben I. Moat"}
+
+    result = convert.enrich_contributor_ids(attrs, array_name="Rapid")
+
+    assert result["contributor_id"] == (
+        "https://orcid.org/0000-0001-8676-7779, https://orcid.org/0000-0001-8676-7779"
+    )
+
+
 def test_enrich_contributor_ids_unknown():
     """Test enriching contributor information with unknown contributor."""
     attrs = {
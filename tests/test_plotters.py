@@ -1,6 +1,7 @@
 """Tests for amocatlas.plotters module."""
 import tempfile
 import os
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -143,10 +144,63 @@ def test_show_variables_by_dimension_with_matching_dim(sample_dataset: xr.Datase
 
 def test_show_variables_by_dimension_no_match(simple_dataset: xr.Dataset) -> None:
     """Test show_variables_by_dimension function with no matching variables."""
-    # Use non-existent dimension - this will cause an error in the current implementation
-    # when there are no matching variables because pandas can't access .dims on empty DataFrame
-    with pytest.raises(AttributeError):
-        plotters.show_variables_by_dimension(simple_dataset, dimension_name="nonexistent")
+    # Use non-existent dimension - the result is an empty table
+    result = plotters.show_variables_by_dimension(simple_dataset, dimension_name="nonexistent")
+
+    assert result.data.empty
+    assert list(result.data.columns) == ["dims", "units", "comment"]
+
+
+def test_show_variables_file(simple_dataset: xr.Dataset) -> None:
+    """Test show_variables function with a netCDF file path."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "simple.nc")
+        simple_dataset.to_netcdf(path)
+
+        df = plotters.show_variables(path).data
+
+    assert list(df.index) == ["moc_mar_hc10", "time"]
+    assert df.loc["moc_mar_hc10", "units"] == "Sverdrup"
+    assert df.loc["moc_mar_hc10", "dims"] == "time"
+
+
+def test_show_variables_string_dims_categorical() -> None:
+    """Test that string-length dimensions are labelled "string" and sorted last."""
+    ds = xr.Dataset(
+        {
+            "b_name": (["strlen8"], np.zeros(8, dtype="S1")),
+            "a_name": (["string16"], np.zeros(16, dtype="S1")),
+            "moc": (["TIME"], np.zeros(3)),
+        }
+    )
+
+    df = plotters.show_variables(ds).data
+
+    assert isinstance(df["dims"].dtype, pd.CategoricalDtype)
+    assert list(df.index) == ["moc", "a_name", "b_name"]
+    assert list(df["dims"]) == ["TIME", "string", "string"]
+
+
+def test_show_attributes_file_cached(simple_dataset: xr.Dataset) -> None:
+    """Test that show_attributes caches file results until the file changes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "simple.nc")
+        simple_dataset.to_netcdf(path)
+
+        first = plotters.show_attributes(path)
+        hits = plotters._show_attributes_from_path.cache_info().hits
+        second = plotters.show_attributes(path)
+        assert plotters._show_attributes_from_path.cache_info().hits == hits + 1
+        pd.testing.assert_frame_equal(first, second)
+
+        # Rewriting the file gives a new modification time and a fresh read
+        simple_dataset.assign_attrs(title="Changed").to_netcdf(path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = plotters.show_attributes(path)
+
+    values = dict(zip(third["Attribute"], third["Value"]))
+    assert values["title"] == "Changed"
 
 
 def test_monthly_resample() -> None:
@@ -163,6 +217,80 @@ def test_monthly_resample() -> None:
     assert len(result) < len(da)  # Should be fewer points
 
 
+def test_monthly_resample_already_monthly() -> None:
+    """Test that monthly input is returned without resampling."""
+    time = pd.date_range("2000-01-01", periods=240, freq="MS")
+    da = xr.DataArray(np.random.randn(240), coords={"TIME": time}, dims=["TIME"])
+
+    assert plotters.monthly_resample(da) is da
+
+
+def test_time_key() -> None:
+    """Test that the time coordinate is found regardless of its case."""
+    for name in ("TIME", "time", "Time"):
+        da = xr.DataArray([1.0, 2.0], coords={name: [0, 1]}, dims=[name])
+        assert plotters._time_key(da) == name
+
+    with pytest.raises(ValueError, match="No time coordinate found"):
+        plotters._time_key(xr.DataArray([1.0, 2.0], dims=["x"]))
+
+
+def test_monthly_resample_unsorted_with_duplicates() -> None:
+    """Test monthly_resample drops NaT/duplicate times and sorts before resampling."""
+    time = pd.to_datetime(
+        ["2020-02-10", "2020-01-05", "2020-01-05", None, "2020-01-20", "2020-02-01"]
+    ).values
+    da = xr.DataArray([3.0, 1.0, 99.0, 50.0, 2.0, 5.0], coords={"time": time}, dims=["time"])
+
+    result = plotters.monthly_resample(da)
+
+    np.testing.assert_allclose(result.values, [1.5, 4.0])
+    assert pd.DatetimeIndex(result["time"].values).is_monotonic_increasing
+
+
+def test_monthly_resample_cached() -> None:
+    """Test that resampling the same DataArray again reuses the cached result."""
+    time = pd.date_range("2020-01-01", periods=100, freq="D")
+    da = xr.DataArray(np.random.randn(100), coords={"time": time}, dims=["time"])
+
+    first = plotters.monthly_resample(da)
+    first.attrs["edited"] = True
+    second = plotters.monthly_resample(da)
+
+    # The cached values are reused, but each call gets its own object
+    assert second is not first
+    assert np.shares_memory(second.values, first.values)
+    assert "edited" not in second.attrs
+
+    other = da.copy()
+    assert not np.shares_memory(plotters.monthly_resample(other).values, first.values)
+
+
+def test_monthly_resample_cache_counts_shared_buffer_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an already monthly input only counts once towards the cache size."""
+    time = pd.date_range("2020-01-01", periods=1000, freq="MS")
+    da = xr.DataArray(np.random.randn(1000), coords={"time": time}, dims=["time"])
+    monkeypatch.setattr(plotters, "_resample_cache", OrderedDict())
+    monkeypatch.setattr(plotters, "_RESAMPLE_CACHE_BYTES", da.nbytes * 3 // 2)
+
+    assert plotters.monthly_resample(da) is da
+    assert len(plotters._resample_cache) == 1
+
+
+def test_plot_amoc_timeseries_dataset_bypasses_resample_cache(
+    simple_dataset: xr.Dataset, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that arrays taken from a Dataset, which can never hit, are not cached."""
+    monkeypatch.setattr(plotters, "_resample_cache", OrderedDict())
+
+    fig, _ = plotters.plot_amoc_timeseries(simple_dataset, varnames=["moc_mar_hc10"])
+    plt.close(fig)
+
+    assert len(plotters._resample_cache) == 0
+
+
 def test_plot_amoc_timeseries_basic(simple_dataset: xr.Dataset) -> None:
     """Test basic AMOC timeseries plotting."""
     fig, ax = plotters.plot_amoc_timeseries(
@@ -244,6 +372,26 @@ def test_plot_amoc_timeseries_error_handling() -> None:
         )
 
 
+def test_decimate_minmax_keeps_extremes() -> None:
+    """Test that min/max decimation keeps each bin's extremes in time order."""
+    x = np.arange(10_000)
+    y = np.sin(x / 50.0)
+    y[1234] = 5.0
+    y[4321] = np.nan
+
+    x_dec, y_dec = plotters._decimate_minmax(x, y, 200)
+
+    assert len(x_dec) <= 200 + 100
+    assert np.all(np.diff(x_dec) >= 0)
+    np.testing.assert_array_equal(y_dec, y[x_dec])
+    assert np.nanmax(y_dec) == 5.0
+    assert np.nanmin(y_dec) == np.nanmin(y)
+
+    # Short series are returned unchanged
+    x_short, y_short = plotters._decimate_minmax(x[:100], y[:100], 200)
+    np.testing.assert_array_equal(x_short, x[:100])
+
+
 def test_plot_monthly_anomalies() -> None:
     """Test monthly anomalies plotting."""
     # Create test data for all required datasets
@@ -271,20 +419,29 @@ def test_plot_monthly_anomalies() -> None:
     plt.close(fig)
 
 
-def test_check_pygmt() -> None:
+def test_check_pygmt(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test PyGMT availability check."""
-    # _check_pygmt doesn't return anything, it just raises or doesn't
-    # Test that it behaves correctly
+    # _check_pygmt returns the module or raises when PyGMT cannot be loaded
     try:
         plotters._check_pygmt()
-        # If we get here, PyGMT is available
         has_pygmt = True
     except ImportError:
         # PyGMT not available, which is fine
         has_pygmt = False
 
-    # Check the module constant matches
+    # HAS_PYGMT is not set at import; the module __getattr__ works it out
+    # through the same lazy _get_pygmt loader each time it is read
+    calls = []
+    get_pygmt = plotters._get_pygmt
+
+    def counting_get_pygmt():
+        calls.append(None)
+        return get_pygmt()
+
+    monkeypatch.setattr(plotters, "_get_pygmt", counting_get_pygmt)
+    assert "HAS_PYGMT" not in vars(plotters)
     assert plotters.HAS_PYGMT == has_pygmt
+    assert len(calls) == 1
 
 
 def test_add_amocatlas_timestamp() -> None:
@@ -393,3 +550,22 @@ def test_show_functions_edge_cases() -> None:
     result3 = plotters.show_variables_by_dimension(minimal_ds, dimension_name="x")
     assert result3 is not None
 
+
+def test_apply_amocatlas_style_applies_every_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the GMT style is sent for every figure, not only when it changes."""
+    calls = []
+
+    class FakePygmt:
+        @staticmethod
+        def config(**kwargs: str) -> None:
+            calls.append(kwargs)
+
+    monkeypatch.setattr(plotters, "_get_pygmt", lambda: FakePygmt)
+
+    plotters._apply_amocatlas_style()
+    plotters._apply_amocatlas_style()
+    plotters._apply_amocatlas_style(FONT_LABEL="18p")
+    assert [c["FONT_LABEL"] for c in calls] == ["20p", "20p", "18p"]
+    assert calls[0] == dict(plotters._AMOCATLAS_GMT_CONFIG)
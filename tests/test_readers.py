@@ -1,7 +1,7 @@
 import pytest
 import xarray as xr
 
-from amocatlas import logger, readers
+from amocatlas import logger, read_osnap, readers
 
 logger.disable_logging()
 
@@ -63,3 +63,50 @@ def test_load_dataset(array_name, expected_var):
         assert (
             "project" in ds.attrs
         ), f"{array_name} dataset should include 'project' metadata"
+
+
+def test_read_osnap_merges_metadata_for_unlisted_file(tmp_path, monkeypatch):
+    file_name = "OSNAP_EXTRA_TEST.nc"
+    monkeypatch.setitem(
+        read_osnap.OSNAP_FILE_URLS, file_name, "https://example.invalid/extra.nc"
+    )
+    xr.Dataset({"MOC_ALL": ("TIME", [1.0, 2.0])}, coords={"TIME": [0, 1]}).to_netcdf(
+        tmp_path / file_name
+    )
+
+    datasets = read_osnap.read_osnap(
+        source=str(tmp_path),
+        file_list=[file_name],
+        transport_only=False,
+        data_dir=tmp_path,
+    )
+
+    assert file_name not in read_osnap._MERGED_METADATA
+    assert datasets[0].attrs["source_file"] == file_name
+    for key, value in read_osnap.OSNAP_METADATA.items():
+        assert datasets[0].attrs[key] == value
+
+
+def test_read_osnap_passes_check_remote(tmp_path, monkeypatch):
+    file_name = "OSNAP_MOC_MHT_MFT_TimeSeries_201408_202207_2025.nc"
+    cached_file = tmp_path / file_name
+    xr.Dataset({"MOC_ALL": ("TIME", [1.0, 2.0])}, coords={"TIME": [0, 1]}).to_netcdf(
+        cached_file
+    )
+    calls = []
+
+    def fake_download_file(url, dest_folder, redownload=False, filename=None, **kw):
+        calls.append(kw.get("check_remote"))
+        return cached_file
+
+    monkeypatch.setattr(read_osnap.utilities, "download_file", fake_download_file)
+
+    # Without the check, the cached file is used as it is
+    read_osnap.read_osnap(file_list=[file_name], data_dir=tmp_path)
+    assert calls == []
+
+    datasets = read_osnap.read_osnap_2025(
+        file_list=[file_name], data_dir=tmp_path, check_remote=True
+    )
+    assert calls == [True]
+    assert datasets[0].attrs["source_path"] == str(cached_file)
@@ -192,6 +192,48 @@ def test_save_dataset_compression_encoding() -> None:
         assert loaded_ds["large_var"].shape == (100,)
         loaded_ds.close()
 
+        # Data variables carry the default compression filters
+        with xr.open_dataset(output_file) as loaded_ds:
+            encoding = loaded_ds["large_var"].encoding
+        assert encoding["zlib"] is True
+        assert encoding["complevel"] == writers.DEFAULT_COMPRESSION["complevel"]
+        assert encoding["shuffle"] is True
+
+
+def test_save_dataset_chunking_encoding() -> None:
+    """Test that numeric data variables are written with bounded chunks."""
+    ds = xr.Dataset(
+        {
+            "series": (["time"], np.random.randn(200_000)),
+            "field": (["time", "depth"], np.zeros((200_000, 3))),
+        },
+        coords={"time": np.arange(200_000), "depth": [0.0, 10.0, 20.0]},
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "test_chunking.nc")
+
+        assert writers.save_dataset(ds, output_file) is True
+
+        with xr.open_dataset(output_file) as loaded_ds:
+            series_chunks = loaded_ds["series"].encoding["chunksizes"]
+            field_chunks = loaded_ds["field"].encoding["chunksizes"]
+            np.testing.assert_array_equal(loaded_ds["series"], ds["series"])
+
+    assert series_chunks == writers._target_chunks(np.dtype("float64"), (200_000,))
+    assert series_chunks[0] < 200_000
+    assert field_chunks[1] == 3
+
+
+def test_target_chunks_redistributes_short_dimensions() -> None:
+    """Test that budget left over by short dimensions goes to the long ones."""
+    chunks = writers._target_chunks(np.dtype("float64"), (8, 200_000))
+
+    assert chunks == (8, 16_384)
+    assert 8 * chunks[0] * chunks[1] == writers._CHUNK_TARGET_BYTES
+    assert writers._target_chunks(np.dtype("float64"), (200_000, 3))[0] > 362
+    assert writers._target_chunks(np.dtype("float64"), (4_000, 4_000)) == (362, 362)
+
 
 def test_save_dataset_type_conversion_fallback() -> None:
     """Test fallback type conversion when TypeError occurs on variable attributes."""
@@ -214,6 +256,13 @@ def test_save_dataset_type_conversion_fallback() -> None:
         assert success is True
         assert os.path.exists(output_file)
 
+        with xr.open_dataset(output_file) as loaded_ds:
+            assert loaded_ds["data"].attrs["bool_attr"] == "True"
+            assert loaded_ds["data"].attrs["set_attr"] == "{1, 2, 3}"
+
+    # The caller's dataset keeps its original attribute values
+    assert ds["data"].attrs["bool_attr"] is True
+
 
 def test_save_dataset_with_global_dict_attrs() -> None:
     """Test that global dict attributes cause failure (not handled by writer)."""
@@ -361,3 +410,61 @@ def test_save_dataset_preserves_original() -> None:
         # Original dataset should be unchanged
         assert original_ds.attrs == original_attrs
         assert original_ds.attrs["test_attr"] is None  # Should still be None
+
+
+def test_save_dataset_datetime_encoding_leaves_original() -> None:
+    """Test that datetime encoding is written without touching the input dataset."""
+    time = pd.date_range("2020-01-01", periods=5, freq="D")
+    ds = xr.Dataset({"data": (["time"], np.random.randn(5))}, coords={"time": time})
+    ds["time"].attrs["units"] = "conflicting_units"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "test_datetime_original.nc")
+
+        assert writers.save_dataset(ds, output_file) is True
+
+        loaded_ds = xr.open_dataset(output_file, decode_times=False)
+        assert loaded_ds["time"].attrs["units"].startswith("seconds since 1970-01-01")
+        loaded_ds.close()
+
+    assert ds["time"].attrs["units"] == "conflicting_units"
+
+
+def test_save_dataset_fast_path_matches_xarray() -> None:
+    """Test that the direct netCDF4 writer produces the same decoded dataset."""
+    time = pd.date_range("2020-01-01", periods=50, freq="D")
+    ds = xr.Dataset(
+        {
+            "moc": (["time"], np.random.randn(50), {"units": "Sv"}),
+            "count": (["time"], np.arange(50, dtype="int32")),
+        },
+        coords={"time": time},
+        attrs={"title": "Fast path", "empty": None},
+    )
+    ds["moc"][3] = np.nan
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        slow_file = os.path.join(tmp_dir, "slow.nc")
+        fast_file = os.path.join(tmp_dir, "fast.nc")
+
+        assert writers.save_dataset(ds, slow_file) is True
+        assert writers.save_dataset(ds, fast_file, fast_path=True) is True
+
+        with xr.open_dataset(slow_file) as slow, xr.open_dataset(fast_file) as fast:
+            xr.testing.assert_identical(slow, fast)
+
+
+def test_save_dataset_fast_path_falls_back() -> None:
+    """Test that datasets the direct writer cannot handle still get saved."""
+    ds = xr.Dataset(
+        {"data": (["x"], [1.0, 2.0, 3.0])},
+        coords={"x": [1, 2, 3], "label": ("x", ["a", "b", "c"])},
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "fallback.nc")
+
+        assert writers.save_dataset(ds, output_file, fast_path=True) is True
+
+        with xr.open_dataset(output_file) as loaded_ds:
+            assert list(loaded_ds["label"].values) == ["a", "b", "c"]